@@ -18,6 +18,21 @@ from fabric_cicd import constants
 from fabric_cicd._common import _exceptions
 from fabric_cicd._common._color import Fore, Style
 
+# Matches ANSI escape codes so the visual length of colored text can be measured
+_ANSI_ESCAPE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+
+
+def _build_level_prefix(level_color: str, level_tag: str) -> str:
+    """Build the colored level tag padded to 8 visual characters."""
+    level_name = f"{level_color}[{level_tag}]"
+    visual_level_length = len(_ANSI_ESCAPE.sub("", level_name))
+    return level_name + " " * max(0, 8 - visual_level_length)
+
+
+def _build_level_prefixes(level_colors: dict[str, str], level_tags: dict[str, str]) -> dict[str, str]:
+    """Build the padded level prefix for every level name that has a tag."""
+    return {level: _build_level_prefix(level_colors.get(level, ""), tag) for level, tag in level_tags.items()}
+
 
 class CustomFormatter(logging.Formatter):
     LEVEL_COLORS: ClassVar[dict[str, str]] = {
@@ -27,37 +42,45 @@ class CustomFormatter(logging.Formatter):
         "ERROR": Fore.RED,
         "CRITICAL": Style.BRIGHT + Fore.RED,
     }
+    LEVEL_TAGS: ClassVar[dict[str, str]] = {
+        "WARNING": "warn",
+        "DEBUG": "debug",
+        "INFO": "info",
+        "ERROR": "error",
+        "CRITICAL": "crit",
+    }
+    # Padded, colored level prefixes are fixed per level name, so build them once
+    LEVEL_PREFIXES: ClassVar[dict[str, str]] = _build_level_prefixes(LEVEL_COLORS, LEVEL_TAGS)
+    UNKNOWN_LEVEL_PREFIX: ClassVar[str] = _build_level_prefix("", "unknown")
+    # Last (second, datefmt, formatted time) pair; records logged within the same second reuse it
+    _time_cache: Optional[tuple[int, str, str]] = None
+
+    def formatTime(self, record: LogRecord, datefmt: Optional[str] = None) -> str:  # noqa: N802
+        # Without a datefmt the stdlib appends milliseconds, so only whole-second formats are cacheable
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        cached = self._time_cache
+        if cached is not None and cached[0] == second and cached[1] == datefmt:
+            return cached[2]
+
+        formatted = super().formatTime(record, datefmt)
+        # Store as one tuple so threads sharing the formatter never see a partially updated cache
+        self._time_cache = (second, datefmt, formatted)
+        return formatted
 
     def format(self, record: LogRecord) -> str:
-        level_color = self.LEVEL_COLORS.get(record.levelname, "")
-        level_name = {
-            "WARNING": "warn",
-            "DEBUG": "debug",
-            "INFO": "info",
-            "ERROR": "error",
-            "CRITICAL": "crit",
-        }.get(record.levelname, "unknown")
-
-        level_name = f"{level_color}[{level_name}]"
-        timestamp = f"{self.formatTime(record, self.datefmt)}"
+        timestamp = self.formatTime(record, self.datefmt)
         message = f"{record.getMessage()}{Style.RESET_ALL}"
 
         # indent if the message contains "->"
         if constants.INDENT in message:
             message = message.replace(constants.INDENT, "")
-            full_message = f"{' ' * 8} {timestamp} - {message}"
-        else:
-            # Calculate visual length by removing ANSI escape codes
-
-            ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-
-            # Get visual length of level_name without ANSI codes
-            visual_level_length = len(ansi_escape.sub("", level_name))
-            # Pad to 16 visual characters
-            padding = " " * max(0, 8 - visual_level_length)
+            return f"{' ' * 8} {timestamp} - {message}"
 
-            full_message = f"{level_name}{padding} {timestamp} - {message}"
-        return full_message
+        level_prefix = self.LEVEL_PREFIXES.get(record.levelname, self.UNKNOWN_LEVEL_PREFIX)
+        return f"{level_prefix} {timestamp} - {message}"
 
 
 class PackageFilter(logging.Filter):
@@ -234,7 +257,7 @@ def get_file_handler(
         (
             h
             for h in target_logger.handlers
-            if isinstance(h, (logging.FileHandler, RotatingFileHandler))
+            if isinstance(h, logging.FileHandler)
             and (getattr(h, _FABRIC_CICD_HANDLER_ATTR, False) if check_managed else True)
         ),
         None,
@@ -337,6 +360,10 @@ def log_header(logger: logging.Logger, message: str) -> None:
         logger: The logger to use for logging the header message.
         message: The header message to log.
     """
+    # Skip building the colored lines when INFO would be discarded anyway
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     line_separator = "#" * 100
     formatted_message = f"########## {message}"
     formatted_message = f"{formatted_message} {line_separator[len(formatted_message) + 1 :]}"
@@ -24,6 +24,8 @@ from fabric_cicd.constants import FeatureFlag, ItemType
 
 logger = logging.getLogger(__name__)
 
+_WORKSPACE_ID_REFERENCE_PATTERN = re.compile(constants.WORKSPACE_ID_REFERENCE_REGEX)
+
 
 class FabricWorkspace:
     """A class to manage and publish workspace items to the Fabric API."""
@@ -342,11 +344,6 @@ class FabricWorkspace:
             if ".platform" in files:
                 item_metadata_path = directory / ".platform"
 
-                # Print a warning and skip directory if empty
-                if not any(directory.iterdir()):
-                    logger.warning(f"Directory {directory.name} is empty.")
-                    continue
-
                 # Attempt to read metadata file
                 try:
                     with Path.open(item_metadata_path, encoding="utf-8") as file:
@@ -617,9 +614,12 @@ class FabricWorkspace:
         Args:
             raw_file: The raw file content where workspace IDs need to be replaced.
         """
-        # Use re.sub to replace all matches
-        return re.sub(
-            constants.WORKSPACE_ID_REFERENCE_REGEX,
+        # Only references holding the default GUID are replaced, so skip the regex scan when it is absent
+        if constants.DEFAULT_GUID not in raw_file:
+            return raw_file
+
+        # Use the precompiled pattern to replace all matches
+        return _WORKSPACE_ID_REFERENCE_PATTERN.sub(
             lambda match: (
                 match.group(0).replace(constants.DEFAULT_GUID, self.workspace_id)
                 if match.group(2) == constants.DEFAULT_GUID
@@ -0,0 +1,30 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+"""Shared pytest configuration for the fabric-cicd test suite."""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+SHM_DIR = Path("/dev/shm")
+TMPFS_ENV_VAR = "FABRIC_CICD_TEST_TMPFS"
+
+
+def pytest_configure(config):
+    """Place pytest's temporary directories on tmpfs when opted in through FABRIC_CICD_TEST_TMPFS."""
+    if os.environ.get(TMPFS_ENV_VAR) != "1" or config.option.basetemp:
+        return
+    if not SHM_DIR.is_dir() or not os.access(SHM_DIR, os.W_OK):
+        return
+    # A unique directory per run keeps concurrent sessions from clearing each other's basetemp
+    config._fabric_cicd_tmpfs_basetemp = tempfile.mkdtemp(dir=SHM_DIR, prefix="pytest-fabric-cicd-")
+    config.option.basetemp = config._fabric_cicd_tmpfs_basetemp
+
+
+def pytest_unconfigure(config):
+    """Remove the tmpfs basetemp created for this run so it does not linger in memory."""
+    basetemp = getattr(config, "_fabric_cicd_tmpfs_basetemp", None)
+    if basetemp:
+        shutil.rmtree(basetemp, ignore_errors=True)
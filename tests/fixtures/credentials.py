@@ -52,7 +52,7 @@ class DummyTokenCredential(TokenCredential):
 
     def get_token(self, *scopes: str, **kwargs: Any) -> AccessToken:  # noqa: ARG002
         """Get the static access token."""
-        self.logger.debug(f"Static token credential - getting token for scopes: {scopes}")
+        self.logger.debug("Static token credential - getting token for scopes: %s", scopes)
         return AccessToken(self._token, self.expiry)
 
     def get_expire(self) -> int:
@@ -11,6 +11,8 @@ Provides transactionally correct responses via:
 - Generic fallback responses for unknown mutation routes
 """
 
+import functools
+import gzip
 import json
 import logging
 import re
@@ -39,6 +41,15 @@ SKIP_HEADERS = {
 }
 
 
+@functools.cache
+def read_trace_file(trace_file: Path) -> dict:
+    """Parse a JSON or gzipped JSON trace file once per path; the parsed traces are only ever read."""
+    # Stream gzipped traces straight into the parser instead of decompressing to disk first
+    opener = gzip.open if trace_file.suffix == ".gz" else Path.open
+    with opener(trace_file, "rb") as f:
+        return json.load(f)
+
+
 class TraceIndex:
     """
     Multi-index for trace lookup: by normalized route, by content (displayName, type),
@@ -96,6 +107,11 @@ class MockFabricAPIHandler(BaseHTTPRequestHandler):
     operation_poll_counts: ClassVar[dict[str, int]] = {}
     content_to_operation: ClassVar[dict[tuple[str, str], str]] = {}
 
+    @property
+    def base_url(self) -> str:
+        """Base URL of the server handling this request, using the port actually bound."""
+        return f"http://127.0.0.1:{self.server.server_port}"
+
     def log_message(self, format, *args):  # noqa: A002
         pass
 
@@ -123,24 +139,24 @@ class MockFabricAPIHandler(BaseHTTPRequestHandler):
     def _handle_request(self, method: str):
         """Route request to appropriate handler, with fallback for unknown routes."""
         route_key = f"{method} {self.path}"
-        logger.info(f"Mock server received: {route_key}")
+        logger.info("Mock server received: %s", route_key)
 
         request_body = self._read_request_body() if method in ("POST", "PATCH") else None
         response = self._find_matching_response(method, self.path, request_body)
 
         if response is None:
             if method in ("PATCH", "DELETE"):
-                logger.info(f"No trace for {route_key}, returning 200 OK")
+                logger.info("No trace for %s, returning 200 OK", route_key)
                 response = HTTPResponse(
                     status_code=200, headers={"Content-Type": "application/json"}, body={}, timestamp=None
                 )
             elif method == "POST":
-                logger.info(f"No trace for {route_key}, returning 202 Accepted")
+                logger.info("No trace for %s, returning 202 Accepted", route_key)
                 response = HTTPResponse(
                     status_code=202, headers={"Content-Type": "application/json"}, body={}, timestamp=None
                 )
             else:
-                logger.warning(f"No trace data for {route_key}")
+                logger.warning("No trace data for %s", route_key)
                 self.send_error(404, f"No trace data found for {route_key}")
                 return
 
@@ -186,7 +202,7 @@ class MockFabricAPIHandler(BaseHTTPRequestHandler):
         traces = self.trace_index.by_content.get(content_key, [])
 
         if not traces:
-            logger.warning(f"No trace for item creation: {display_name} ({item_type})")
+            logger.warning("No trace for item creation: %s (%s)", display_name, item_type)
             return None
 
         for _, response in traces:
@@ -195,8 +211,8 @@ class MockFabricAPIHandler(BaseHTTPRequestHandler):
                     with self.route_lock:
                         self.content_to_operation[(display_name, item_type)] = op_id
                         self.operation_poll_counts[op_id] = 0
-                    logger.info(f"Tracking operation {op_id} for {display_name} ({item_type})")
-                logger.info(f"Matched item creation: {display_name} ({item_type}) -> {response.status_code}")
+                    logger.info("Tracking operation %s for %s (%s)", op_id, display_name, item_type)
+                logger.info("Matched item creation: %s (%s) -> %s", display_name, item_type, response.status_code)
                 return response
 
         return traces[-1][1]
@@ -214,12 +230,12 @@ class MockFabricAPIHandler(BaseHTTPRequestHandler):
                     break
 
         if not op_data:
-            logger.warning(f"No operation data for {operation_id}")
+            logger.warning("No operation data for %s", operation_id)
             return None
 
         if is_result:
             if op_data["result"]:
-                logger.info(f"Returning operation result for {operation_id}")
+                logger.info("Returning operation result for %s", operation_id)
                 return op_data["result"][1]
             msg = (
                 f"No operation result trace found for operation {operation_id}. "
@@ -238,16 +254,16 @@ class MockFabricAPIHandler(BaseHTTPRequestHandler):
         poll_traces = op_data.get("poll", [])
         if not poll_traces:
             # No poll traces at all: synthesize based on target status
-            poll_url = f"http://127.0.0.1:{MOCK_SERVER_PORT}/v1/operations/{operation_id}"
+            poll_url = f"{self.base_url}/v1/operations/{operation_id}"
             if target_status == "Running":
-                logger.info(f"Operation {operation_id} poll #{poll_count}: synthesizing Running (no poll traces)")
+                logger.info("Operation %s poll #%s: synthesizing Running (no poll traces)", operation_id, poll_count)
                 return HTTPResponse(
                     status_code=200,
                     headers={"Content-Type": "application/json", "Location": poll_url},
                     body={"status": "Running"},
                     timestamp=None,
                 )
-            logger.info(f"Operation {operation_id} poll #{poll_count}: synthesizing Succeeded (no poll traces)")
+            logger.info("Operation %s poll #%s: synthesizing Succeeded (no poll traces)", operation_id, poll_count)
             return HTTPResponse(
                 status_code=200,
                 headers={"Content-Type": "application/json", "Location": f"{poll_url}/result"},
@@ -257,13 +273,13 @@ class MockFabricAPIHandler(BaseHTTPRequestHandler):
 
         for _, response in poll_traces:
             if isinstance(response.body, dict) and response.body.get("status") == target_status:
-                logger.info(f"Operation {operation_id} poll #{poll_count}: {target_status}")
+                logger.info("Operation %s poll #%s: %s", operation_id, poll_count, target_status)
                 return response
 
         # No trace matching target_status: synthesize to maintain Running→Succeeded state machine
-        poll_url = f"http://127.0.0.1:{MOCK_SERVER_PORT}/v1/operations/{operation_id}"
+        poll_url = f"{self.base_url}/v1/operations/{operation_id}"
         if target_status == "Running":
-            logger.info(f"Operation {operation_id} poll #{poll_count}: synthesizing Running (no trace found)")
+            logger.info("Operation %s poll #%s: synthesizing Running (no trace found)", operation_id, poll_count)
             return HTTPResponse(
                 status_code=200,
                 headers={"Content-Type": "application/json", "Location": poll_url},
@@ -271,7 +287,7 @@ class MockFabricAPIHandler(BaseHTTPRequestHandler):
                 timestamp=None,
             )
 
-        logger.info(f"Operation {operation_id} poll #{poll_count}: synthesizing Succeeded (no trace found)")
+        logger.info("Operation %s poll #%s: synthesizing Succeeded (no trace found)", operation_id, poll_count)
         return HTTPResponse(
             status_code=200,
             headers={"Content-Type": "application/json", "Location": f"{poll_url}/result"},
@@ -293,26 +309,23 @@ class MockFabricAPIHandler(BaseHTTPRequestHandler):
                 self.send_header(name, value)
             elif lower == "location" and "operations" in value and (op_match := OPERATION_PATTERN.search(value)):
                 suffix = "/result" if op_match.group(2) == "/result" else ""
-                self.send_header(
-                    "Location", f"http://127.0.0.1:{MOCK_SERVER_PORT}/v1/operations/{op_match.group(1)}{suffix}"
-                )
+                self.send_header("Location", f"{self.base_url}/v1/operations/{op_match.group(1)}{suffix}")
             elif lower not in SKIP_HEADERS:
                 self.send_header(name, value)
 
         self.send_header("Content-Length", len(body_bytes))
         self.end_headers()
         self.wfile.write(body_bytes)
-        logger.debug(f"Responded to {route_key}: {response.status_code}")
+        logger.debug("Responded to %s: %s", route_key, response.status_code)
 
     @classmethod
     def load_trace_data(cls, trace_file: Path):
-        """Load trace data from JSON file and build indices."""
+        """Load trace data from a JSON or gzipped JSON file and build indices."""
         cls.trace_index = TraceIndex()
         cls.operation_poll_counts.clear()
         cls.content_to_operation.clear()
 
-        with trace_file.open("r") as f:
-            data = json.load(f)
+        data = read_trace_file(trace_file)
 
         loaded = 0
         for trace in data.get("traces", []):
@@ -334,10 +347,14 @@ class MockFabricAPIHandler(BaseHTTPRequestHandler):
                 )
                 loaded += 1
             except Exception as e:
-                logger.warning(f"Failed to parse trace: {e}")
+                logger.warning("Failed to parse trace: %s", e)
 
         logger.info(
-            f"Loaded {loaded} traces (routes={len(cls.trace_index.by_route)}, content={len(cls.trace_index.by_content)}, ops={len(cls.trace_index.by_operation)})"
+            "Loaded %s traces (routes=%s, content=%s, ops=%s)",
+            loaded,
+            len(cls.trace_index.by_route),
+            len(cls.trace_index.by_content),
+            len(cls.trace_index.by_operation),
         )
 
 
@@ -356,9 +373,12 @@ class MockFabricServer:
         """Start the mock server in a background thread."""
         MockFabricAPIHandler.load_trace_data(self.trace_file)
         self.server = HTTPServer(("127.0.0.1", self.port), MockFabricAPIHandler)
-        self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        # Port 0 asks the OS for a free port, so record the one actually bound
+        self.port = self.server.server_port
+        # A short poll interval keeps shutdown() from waiting out the default half second
+        self.server_thread = threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True)
         self.server_thread.start()
-        logger.info(f"Mock Fabric API server started on http://127.0.0.1:{self.port}")
+        logger.info("Mock Fabric API server started on http://127.0.0.1:%s", self.port)
 
     def stop(self):
         """Stop the mock server."""
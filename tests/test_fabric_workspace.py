@@ -1,9 +1,9 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 
+import functools
 import json
 import re
-import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -12,13 +12,38 @@ import yaml
 from fixtures.credentials import DummyTokenCredential
 
 from fabric_cicd import configure_fabric_fqdn
+from fabric_cicd._common._fabric_endpoint import FabricEndpoint
 from fabric_cicd.fabric_workspace import FabricWorkspace, constants
 
+VALID_WORKSPACE_ID = "12345678-1234-5678-abcd-1234567890ab"
+TARGET_WORKSPACE_ITEMS_URL = f"{constants.DEFAULT_API_ROOT_URL}/v1/workspaces/target-workspace-id/items"
+TEST_LAKEHOUSE_URL = f"{constants.DEFAULT_API_ROOT_URL}/v1/workspaces/test-workspace-id/lakehouses/test-item-guid"
+TEST_MIRRORED_DATABASE_URL = (
+    f"{constants.DEFAULT_API_ROOT_URL}/v1/workspaces/test-workspace-id/mirroreddatabases/test-item-guid"
+)
+
+
+class FakeEndpoint:
+    """Minimal FabricEndpoint stand-in that records invoke calls and returns canned responses."""
+
+    __slots__ = ("calls", "response", "side_effect")
+
+    def __init__(self):
+        self.calls = []
+        self.response = None
+        self.side_effect = None
+
+    def invoke(self, method, url, **kwargs):
+        self.calls.append({"method": method, "url": url, **kwargs})
+        if self.side_effect is not None:
+            return self.side_effect(method=method, url=url, **kwargs)
+        return self.response
+
 
 @pytest.fixture
 def mock_endpoint():
     """Mock FabricEndpoint to avoid real API calls."""
-    mock = MagicMock()
+    endpoint = FakeEndpoint()
 
     def mock_invoke(method, url, body=None, **_kwargs):
         if method == "POST" and url.endswith("/items"):
@@ -36,24 +61,35 @@ def mock_endpoint():
             return {"body": {"message": "Item metadata updated successfully"}}
         return {"body": {"value": []}}
 
-    mock.invoke.side_effect = mock_invoke
-    return mock
+    endpoint.side_effect = mock_invoke
+    return endpoint
 
 
 @pytest.fixture
-def temp_workspace_dir():
-    """Create a temporary directory structure for testing."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield Path(temp_dir)
+def mock_fabric_endpoint():
+    """Provide a FakeEndpoint for tests that assign it to workspace.endpoint and drive invoke responses directly."""
+    return FakeEndpoint()
 
 
 @pytest.fixture
+def temp_workspace_dir(tmp_path_factory):
+    """Create a temporary directory structure for testing, unique per test and per xdist worker."""
+    return tmp_path_factory.mktemp("workspace")
+
+
+@pytest.fixture(scope="module")
+def empty_workspace_dir(tmp_path_factory):
+    """Create an empty repository directory shared by tests that never write to it."""
+    return tmp_path_factory.mktemp("empty_workspace")
+
+
+@pytest.fixture(scope="module")
 def valid_workspace_id():
     """Return a valid workspace ID in GUID format."""
-    return "12345678-1234-5678-abcd-1234567890ab"
+    return VALID_WORKSPACE_ID
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def utf8_test_chars():
     """Provide sample UTF-8 characters for testing."""
     return {"nordic": "Ö æ ø", "european": "ñ é ü ß ç", "asian": "你好", "mixed": "ñ é ü ß ç 你好"}
@@ -74,78 +110,98 @@ def create_parameter_file(dir_path, utf8_chars):
         ]
     }
 
-    with parameter_file_path.open("w", encoding="utf-8") as f:
-        yaml.dump(parameter_content, f, allow_unicode=True)
+    # Use the LibYAML emitter when PyYAML was built with it
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    parameter_file_path.write_bytes(yaml.dump(parameter_content, Dumper=dumper, allow_unicode=True, encoding="utf-8"))
 
     return parameter_content
 
 
 def create_platform_metadata(dir_path, utf8_chars):
     """Create a .platform metadata file with UTF-8 characters."""
-    item_dir = dir_path / "test_item"
+    return create_platform_file(
+        dir_path / "test_item",
+        "Notebook",
+        f"Test Notebook with {utf8_chars['nordic']}",
+        "test-logical-id",
+        description=f"Description with {utf8_chars['mixed']}",
+    )
+
+
+def create_platform_file(item_dir, item_type, display_name, logical_id, description=""):
+    """Create an item directory with a .platform file and an empty placeholder content file."""
     item_dir.mkdir(parents=True, exist_ok=True)
     platform_file_path = item_dir / ".platform"
     metadata_content = {
-        "metadata": {
-            "type": "Notebook",
-            "displayName": f"Test Notebook with {utf8_chars['nordic']}",
-            "description": f"Description with {utf8_chars['mixed']}",
-        },
-        "config": {"logicalId": "test-logical-id"},
+        "metadata": {"type": item_type, "displayName": display_name, "description": description},
+        "config": {"logicalId": logical_id},
     }
-
-    with platform_file_path.open("w", encoding="utf-8") as f:
-        json.dump(metadata_content, f, ensure_ascii=False)
-
-    with (item_dir / "dummy.txt").open("w", encoding="utf-8") as f:
-        f.write("Dummy file")
-
-    return metadata_content
+    platform_file_path.write_bytes(json.dumps(metadata_content, ensure_ascii=False).encode("utf-8"))
+    (item_dir / "dummy.txt").touch()
+    return platform_file_path
 
 
 @pytest.fixture
-def patched_fabric_workspace(mock_endpoint):
+def patched_fabric_workspace(mock_endpoint, monkeypatch):
     """Return a factory function to create a patched FabricWorkspace."""
+    # Patch once per test; monkeypatch restores the attribute at teardown
+    monkeypatch.setattr("fabric_cicd.fabric_workspace.FabricEndpoint", lambda *_args, **_kwargs: mock_endpoint)
 
     def _create_workspace(workspace_id, repository_directory, item_type_in_scope=None, **kwargs):
-        fabric_endpoint_patch = patch("fabric_cicd.fabric_workspace.FabricEndpoint", return_value=mock_endpoint)
-        refresh_items_patch = patch.object(
-            FabricWorkspace, "_refresh_deployed_items", new=lambda self: setattr(self, "deployed_items", {})
-        )
-        refresh_folders_patch = patch.object(
-            FabricWorkspace, "_refresh_deployed_folders", new=lambda self: setattr(self, "deployed_folders", {})
+        workspace = FabricWorkspace(
+            workspace_id=workspace_id,
+            repository_directory=repository_directory,
+            item_type_in_scope=item_type_in_scope,
+            token_credential=DummyTokenCredential(),
+            **kwargs,
         )
+        # Populate repository data; deployed items and folders start empty from __init__
+        workspace._refresh_repository_folders()
+        workspace._refresh_repository_items()
+
+        return workspace
+
+    return _create_workspace
+
+
+@pytest.fixture
+def skip_repository_items_refresh(monkeypatch):
+    """Skip scanning the repository directory when constructing FabricWorkspace."""
+    monkeypatch.setattr(FabricWorkspace, "_refresh_repository_items", lambda _self: None)
+
+
+@pytest.fixture(scope="module")
+def cached_fabric_workspace(empty_workspace_dir):
+    """Return a memoized factory of patched FabricWorkspace instances shared across the module.
+
+    Only suitable for tests that exercise content transforms such as _replace_workspace_ids
+    and do not mutate the workspace or its repository directory.
+    """
 
-        with fabric_endpoint_patch, refresh_items_patch, refresh_folders_patch:
-            workspace = FabricWorkspace(
+    @functools.cache
+    def _get_workspace(workspace_id, item_type_in_scope):
+        with patch("fabric_cicd.fabric_workspace.FabricEndpoint", return_value=FakeEndpoint()):
+            return FabricWorkspace(
                 workspace_id=workspace_id,
-                repository_directory=repository_directory,
-                item_type_in_scope=item_type_in_scope,
+                repository_directory=str(empty_workspace_dir),
+                item_type_in_scope=list(item_type_in_scope),
                 token_credential=DummyTokenCredential(),
-                **kwargs,
             )
-            # Call refresh methods to populate workspace data
-            workspace._refresh_deployed_folders()
-            workspace._refresh_repository_folders()
-            workspace._refresh_deployed_items()
-            workspace._refresh_repository_items()
-
-            return workspace
 
-    return _create_workspace
+    return lambda workspace_id, item_type_in_scope: _get_workspace(workspace_id, tuple(item_type_in_scope))
 
 
+@pytest.mark.usefixtures("skip_repository_items_refresh")
 def test_parameter_file_with_utf8_chars(
     temp_workspace_dir, patched_fabric_workspace, valid_workspace_id, utf8_test_chars
 ):
     """Test that parameter file with UTF-8 characters is read correctly."""
     create_parameter_file(temp_workspace_dir, utf8_test_chars)
-    with patch.object(FabricWorkspace, "_refresh_repository_items"):
-        workspace = patched_fabric_workspace(
-            workspace_id=valid_workspace_id,
-            repository_directory=str(temp_workspace_dir),
-            item_type_in_scope=["Environment"],
-        )
+    workspace = patched_fabric_workspace(
+        workspace_id=valid_workspace_id,
+        repository_directory=str(temp_workspace_dir),
+        item_type_in_scope=["Environment"],
+    )
 
     key1 = f"Production {utf8_test_chars['mixed']}"
     key2 = utf8_test_chars["nordic"]
@@ -178,25 +234,24 @@ def test_platform_metadata_with_utf8_chars(
     assert item.description == f"Description with {utf8_test_chars['mixed']}"
 
 
+@pytest.mark.usefixtures("skip_repository_items_refresh")
 def test_environment_param_with_utf8_chars(
-    temp_workspace_dir, patched_fabric_workspace, valid_workspace_id, utf8_test_chars
+    empty_workspace_dir, patched_fabric_workspace, valid_workspace_id, utf8_test_chars
 ):
     """Test that environment parameter with UTF-8 characters is preserved."""
-    with patch.object(FabricWorkspace, "_refresh_repository_items"):
-        workspace = patched_fabric_workspace(
-            workspace_id=valid_workspace_id,
-            repository_directory=str(temp_workspace_dir),
-            item_type_in_scope=["Environment"],
-            environment=utf8_test_chars["nordic"],
-        )
+    workspace = patched_fabric_workspace(
+        workspace_id=valid_workspace_id,
+        repository_directory=str(empty_workspace_dir),
+        item_type_in_scope=["Environment"],
+        environment=utf8_test_chars["nordic"],
+    )
 
     assert workspace.environment == utf8_test_chars["nordic"]
 
 
-def test_workspace_id_replacement_in_json(patched_fabric_workspace, valid_workspace_id, temp_workspace_dir):
-    """Test that workspace IDs are properly replaced in JSON files (like pipeline-content.json)."""
-    # JSON content with workspace ID that should be replaced
-    json_content = """{
+WORKSPACE_ID_REPLACEMENT_CASES = [
+    pytest.param(
+        """{
   "properties": {
     "activities": [
       {
@@ -208,55 +263,28 @@ def test_workspace_id_replacement_in_json(patched_fabric_workspace, valid_worksp
       }
     ]
   }
-}"""
-
-    with patch.object(FabricWorkspace, "_refresh_repository_items"):
-        workspace = patched_fabric_workspace(
-            workspace_id=valid_workspace_id,
-            repository_directory=str(temp_workspace_dir),
-            item_type_in_scope=["DataPipeline"],
-        )
-
-    # Test the workspace ID replacement function
-    result = workspace._replace_workspace_ids(json_content)
-
-    # Verify that the default workspace ID was replaced with the target workspace ID
-    assert "00000000-0000-0000-0000-000000000000" not in result
-    assert valid_workspace_id in result
-    assert '"workspaceId": "' + valid_workspace_id + '"' in result
-
-
-def test_workspace_id_replacement_in_python(patched_fabric_workspace, valid_workspace_id, temp_workspace_dir):
-    """Test that workspace IDs are properly replaced in Python files (like notebook-content.py)."""
-    # Python content with workspace ID that should be replaced (as in notebook metadata)
-    python_content = """# META {
+}""",
+        1,
+        [f'"workspaceId": "{VALID_WORKSPACE_ID}"'],
+        [],
+        id="pipeline_json",
+    ),
+    pytest.param(
+        """# META {
 # META   "dependencies": {
 # META     "environment": {
 # META       "environmentId": "a277ea4a-e87f-8537-4ce0-39db11d4aade",
 # META       "workspaceId": "00000000-0000-0000-0000-000000000000"
 # META     }
 # META   }
-# META }"""
-
-    with patch.object(FabricWorkspace, "_refresh_repository_items"):
-        workspace = patched_fabric_workspace(
-            workspace_id=valid_workspace_id,
-            repository_directory=str(temp_workspace_dir),
-            item_type_in_scope=["Notebook"],
-        )
-
-    # Test the workspace ID replacement function
-    result = workspace._replace_workspace_ids(python_content)
-
-    # Verify that the default workspace ID was replaced with the target workspace ID
-    assert "00000000-0000-0000-0000-000000000000" not in result
-    assert valid_workspace_id in result
-    assert 'workspaceId": "' + valid_workspace_id + '"' in result
-
-
-def test_workspace_id_replacement_eventstream_json(patched_fabric_workspace, valid_workspace_id, temp_workspace_dir):
-    """Test workspace ID replacement in Eventstream JSON files with multiple occurrences."""
-    eventstream_content = """{
+# META }""",
+        1,
+        [f'workspaceId": "{VALID_WORKSPACE_ID}"'],
+        [],
+        id="notebook_python",
+    ),
+    pytest.param(
+        """{
   "destinations": [
     {
       "name": "DataActivator",
@@ -283,25 +311,14 @@ def test_workspace_id_replacement_eventstream_json(patched_fabric_workspace, val
       }
     }
   ]
-}"""
-
-    with patch.object(FabricWorkspace, "_refresh_repository_items"):
-        workspace = patched_fabric_workspace(
-            workspace_id=valid_workspace_id,
-            repository_directory=str(temp_workspace_dir),
-            item_type_in_scope=["Eventstream"],
-        )
-
-    result = workspace._replace_workspace_ids(eventstream_content)
-
-    # Verify all three workspace IDs were replaced
-    assert "00000000-0000-0000-0000-000000000000" not in result
-    assert result.count(f'"workspaceId": "{valid_workspace_id}"') == 3
-
-
-def test_workspace_id_replacement_yaml_format(patched_fabric_workspace, valid_workspace_id, temp_workspace_dir):
-    """Test workspace ID replacement in YAML-style formats."""
-    yaml_content = """
+}""",
+        3,
+        [f'"workspaceId": "{VALID_WORKSPACE_ID}"'],
+        [],
+        id="eventstream_json",
+    ),
+    pytest.param(
+        """
 configuration:
   lakehouse:
     default_lakehouse_workspace_id: "00000000-0000-0000-0000-000000000000"
@@ -309,27 +326,18 @@ configuration:
     workspaceId = "00000000-0000-0000-0000-000000000000"
   other:
     workspace: "00000000-0000-0000-0000-000000000000"
-"""
-
-    with patch.object(FabricWorkspace, "_refresh_repository_items"):
-        workspace = patched_fabric_workspace(
-            workspace_id=valid_workspace_id,
-            repository_directory=str(temp_workspace_dir),
-            item_type_in_scope=["Environment"],
-        )
-
-    result = workspace._replace_workspace_ids(yaml_content)
-
-    # Verify all different property name formats are replaced
-    assert "00000000-0000-0000-0000-000000000000" not in result
-    assert f'default_lakehouse_workspace_id: "{valid_workspace_id}"' in result
-    assert f'workspaceId = "{valid_workspace_id}"' in result
-    assert f'workspace: "{valid_workspace_id}"' in result
-
-
-def test_workspace_id_replacement_mixed_formats(patched_fabric_workspace, valid_workspace_id, temp_workspace_dir):
-    """Test workspace ID replacement with mixed JSON and YAML formats in same content."""
-    mixed_content = """{
+""",
+        3,
+        [
+            f'default_lakehouse_workspace_id: "{VALID_WORKSPACE_ID}"',
+            f'workspaceId = "{VALID_WORKSPACE_ID}"',
+            f'workspace: "{VALID_WORKSPACE_ID}"',
+        ],
+        [],
+        id="yaml_format",
+    ),
+    pytest.param(
+        """{
   "pipeline": {
     "properties": {
       "workspaceId": "00000000-0000-0000-0000-000000000000"
@@ -339,29 +347,18 @@ def test_workspace_id_replacement_mixed_formats(patched_fabric_workspace, valid_
     "default_lakehouse_workspace_id": "00000000-0000-0000-0000-000000000000",
     "workspace" = "00000000-0000-0000-0000-000000000000"
   }
-}"""
-
-    with patch.object(FabricWorkspace, "_refresh_repository_items"):
-        workspace = patched_fabric_workspace(
-            workspace_id=valid_workspace_id,
-            repository_directory=str(temp_workspace_dir),
-            item_type_in_scope=["DataPipeline"],
-        )
-
-    result = workspace._replace_workspace_ids(mixed_content)
-
-    # Verify all formats are replaced correctly
-    assert "00000000-0000-0000-0000-000000000000" not in result
-    assert f'"workspaceId": "{valid_workspace_id}"' in result
-    assert f'"default_lakehouse_workspace_id": "{valid_workspace_id}"' in result
-    assert f'"workspace" = "{valid_workspace_id}"' in result
-
-
-def test_workspace_id_replacement_whitespace_variations(
-    patched_fabric_workspace, valid_workspace_id, temp_workspace_dir
-):
-    """Test workspace ID replacement with various whitespace patterns."""
-    whitespace_content = """
+}""",
+        3,
+        [
+            f'"workspaceId": "{VALID_WORKSPACE_ID}"',
+            f'"default_lakehouse_workspace_id": "{VALID_WORKSPACE_ID}"',
+            f'"workspace" = "{VALID_WORKSPACE_ID}"',
+        ],
+        [],
+        id="mixed_formats",
+    ),
+    pytest.param(
+        """
 {
   "test1": {
     "workspaceId":"00000000-0000-0000-0000-000000000000"
@@ -376,68 +373,43 @@ def test_workspace_id_replacement_whitespace_variations(
     "workspace"    :    "00000000-0000-0000-0000-000000000000"
   }
 }
-"""
-
-    with patch.object(FabricWorkspace, "_refresh_repository_items"):
-        workspace = patched_fabric_workspace(
-            workspace_id=valid_workspace_id,
-            repository_directory=str(temp_workspace_dir),
-            item_type_in_scope=["DataPipeline"],
-        )
-
-    result = workspace._replace_workspace_ids(whitespace_content)
-
-    # Verify all whitespace variations are handled
-    assert "00000000-0000-0000-0000-000000000000" not in result
-    assert result.count(valid_workspace_id) == 4
-
-
-def test_workspace_id_replacement_non_default_values_preserved(
-    patched_fabric_workspace, valid_workspace_id, temp_workspace_dir
-):
-    """Test that non-default workspace IDs are NOT replaced (regression test)."""
-    # Use a different workspace ID that should not be replaced
-    other_workspace_id = "12345678-1234-1234-1234-123456789012"
-    content_with_other_id = f'''{{
-  "properties": {{
+""",
+        4,
+        [],
+        [],
+        id="whitespace_variations",
+    ),
+    # Regression test: only the default workspace ID is replaced, other IDs are preserved
+    pytest.param(
+        """{
+  "properties": {
     "activities": [
-      {{
+      {
         "type": "TridentNotebook",
-        "typeProperties": {{
-          "workspaceId": "{other_workspace_id}",
+        "typeProperties": {
+          "workspaceId": "12345678-1234-1234-1234-123456789012",
           "notebookId": "99b570c5-0c79-9dc4-4c9b-fa16c621384c"
-        }}
-      }},
-      {{
+        }
+      },
+      {
         "type": "TridentNotebook",
-        "typeProperties": {{
+        "typeProperties": {
           "workspaceId": "00000000-0000-0000-0000-000000000000",
           "notebookId": "88a570c5-0c79-9dc4-4c9b-fa16c621384c"
-        }}
-      }}
+        }
+      }
     ]
-  }}
-}}'''
-
-    with patch.object(FabricWorkspace, "_refresh_repository_items"):
-        workspace = patched_fabric_workspace(
-            workspace_id=valid_workspace_id,
-            repository_directory=str(temp_workspace_dir),
-            item_type_in_scope=["DataPipeline"],
-        )
-
-    result = workspace._replace_workspace_ids(content_with_other_id)
-
-    # Verify only default workspace ID was replaced, other ID preserved
-    assert "00000000-0000-0000-0000-000000000000" not in result
-    assert other_workspace_id in result  # This should be preserved
-    assert result.count(valid_workspace_id) == 1  # Only one replacement
-    assert result.count(other_workspace_id) == 1  # Original preserved
-
-
-def test_workspace_id_replacement_edge_cases(patched_fabric_workspace, valid_workspace_id, temp_workspace_dir):
-    """Test workspace ID replacement edge cases and current regex behavior."""
-    edge_cases_content = """
+  }
+}""",
+        1,
+        [],
+        ['"workspaceId": "12345678-1234-1234-1234-123456789012"'],
+        id="non_default_values_preserved",
+    ),
+    # Documents the current regex behavior: comments and suffix matches like "notworkspaceId" are
+    # replaced (comment, validCase1, validCase2, invalidCase2, validCase3), prefix matches are not
+    pytest.param(
+        """
 // Comment with workspaceId: "00000000-0000-0000-0000-000000000000" - this gets replaced due to current regex
 {
   "validCase1": {
@@ -456,31 +428,65 @@ def test_workspace_id_replacement_edge_cases(patched_fabric_workspace, valid_wor
     workspace: "00000000-0000-0000-0000-000000000000"
   }
 }
-"""
+""",
+        5,
+        [f'"notworkspaceId": "{VALID_WORKSPACE_ID}"', f'// Comment with workspaceId: "{VALID_WORKSPACE_ID}"'],
+        ['"workspaceIdNot": "00000000-0000-0000-0000-000000000000"'],
+        id="edge_cases",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("content", "expected_count", "expected_fragments", "preserved_fragments"), WORKSPACE_ID_REPLACEMENT_CASES
+)
+def test_workspace_id_replacement(
+    cached_fabric_workspace, valid_workspace_id, content, expected_count, expected_fragments, preserved_fragments
+):
+    """Test that default workspace IDs are replaced with the target workspace ID across file formats."""
+    workspace = cached_fabric_workspace(valid_workspace_id, ["DataPipeline"])
 
-    with patch.object(FabricWorkspace, "_refresh_repository_items"):
-        workspace = patched_fabric_workspace(
-            workspace_id=valid_workspace_id,
-            repository_directory=str(temp_workspace_dir),
-            item_type_in_scope=["DataPipeline"],
-        )
+    result = workspace._replace_workspace_ids(content)
 
-    result = workspace._replace_workspace_ids(edge_cases_content)
+    # Each replacement consumes exactly one default workspace ID
+    assert result.count(valid_workspace_id) == expected_count
+    assert result.count(constants.DEFAULT_GUID) == content.count(constants.DEFAULT_GUID) - expected_count
+    for fragment in expected_fragments:
+        assert fragment in result
+    for fragment in preserved_fragments:
+        assert fragment in result
 
-    # Current regex behavior: matches comments and partial matches like "notworkspaceId"
-    # This documents the current behavior for regression testing
-    assert result.count(valid_workspace_id) == 5  # comment, validCase1, validCase2, invalidCase2, validCase3
-    assert '"workspaceIdNot": "00000000-0000-0000-0000-000000000000"' in result  # Should not be replaced (prefix case)
-    assert f'"notworkspaceId": "{valid_workspace_id}"' in result  # Gets replaced (suffix matches workspaceId)
-    assert f'// Comment with workspaceId: "{valid_workspace_id}"' in result  # Comment gets replaced
 
+def test_workspace_id_replacement_without_default_guid_returns_input(cached_fabric_workspace, valid_workspace_id):
+    """Test that content without the default GUID is returned as-is without a regex scan."""
+    content = '{"workspaceId": "12345678-1234-1234-1234-123456789012"}'
+    workspace = cached_fabric_workspace(valid_workspace_id, ["DataPipeline"])
 
-def test_workspace_id_replacement_comprehensive_item_types(
-    patched_fabric_workspace, valid_workspace_id, temp_workspace_dir
-):
-    """Test workspace ID replacement across different item type contexts."""
-    # Test content that might appear in different item types
-    comprehensive_content = """
+    with patch("fabric_cicd.fabric_workspace._WORKSPACE_ID_REFERENCE_PATTERN") as mock_pattern:
+        result = workspace._replace_workspace_ids(content)
+
+    assert result is content
+    mock_pattern.sub.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        '"workspaceId"' + " " * 10000 + ': "' + "00000000-0000-0000-0000-000000000000",
+        '"workspaceId"' + " " * 10000 + " 00000000-0000-0000-0000-000000000000",
+        ('"workspace": "' + " " * 100) * 1000 + "00000000-0000-0000-0000-000000000000",
+    ],
+    ids=["unterminated_value", "missing_separator", "repeated_unterminated_keys"],
+)
+def test_workspace_id_replacement_malformed_input_completes(cached_fabric_workspace, valid_workspace_id, content):
+    """Test that malformed references with long whitespace runs are left unchanged."""
+    workspace = cached_fabric_workspace(valid_workspace_id, ["DataPipeline"])
+
+    assert workspace._replace_workspace_ids(content) == content
+
+
+# Workspace ID references as they appear across different item types
+ITEM_TYPES_WORKSPACE_ID_CONTENT = """
 {
   "notebook": {
     "metadata": {
@@ -512,24 +518,20 @@ def test_workspace_id_replacement_comprehensive_item_types(
 }
 """
 
-    # Test with different item types to ensure the replacement works regardless of item type context
-    item_types_to_test = ["Notebook", "DataPipeline", "Eventstream", "Lakehouse", "Environment"]
 
-    for item_type in item_types_to_test:
-        with patch.object(FabricWorkspace, "_refresh_repository_items"):
-            workspace = patched_fabric_workspace(
-                workspace_id=valid_workspace_id,
-                repository_directory=str(temp_workspace_dir),
-                item_type_in_scope=[item_type],
-            )
+@pytest.mark.parametrize("item_type", ["Notebook", "DataPipeline", "Eventstream", "Lakehouse", "Environment"])
+def test_workspace_id_replacement_comprehensive_item_types(cached_fabric_workspace, valid_workspace_id, item_type):
+    """Test workspace ID replacement across different item type contexts."""
+    workspace = cached_fabric_workspace(valid_workspace_id, [item_type])
 
-        result = workspace._replace_workspace_ids(comprehensive_content)
+    result = workspace._replace_workspace_ids(ITEM_TYPES_WORKSPACE_ID_CONTENT)
 
-        # Verify all workspace IDs are replaced regardless of item type context
-        assert "00000000-0000-0000-0000-000000000000" not in result, f"Failed for item type: {item_type}"
-        assert result.count(valid_workspace_id) == 5, f"Incorrect replacement count for item type: {item_type}"
+    # Verify all workspace IDs are replaced regardless of item type context
+    assert "00000000-0000-0000-0000-000000000000" not in result
+    assert result.count(valid_workspace_id) == 5
 
 
+@pytest.mark.usefixtures("skip_repository_items_refresh")
 def test_environment_parameter_replacement_issue(patched_fabric_workspace, temp_workspace_dir, valid_workspace_id):
     """Test that parameter replacement works correctly with different environment values.
 
@@ -549,7 +551,7 @@ find_replace:
 
     # Create notebook structure
     notebook_dir = temp_workspace_dir / "Test Notebook.Notebook"
-    notebook_dir.mkdir(parents=True)
+    notebook_dir.mkdir()
 
     notebook_content = 'test_value = "test-guid-to-replace"'
 
@@ -561,21 +563,19 @@ find_replace:
     from fabric_cicd._common._item import Item
 
     # Test 1: Without environment parameter (defaults to 'N/A')
-    with patch.object(FabricWorkspace, "_refresh_repository_items"):
-        workspace_no_env = patched_fabric_workspace(
-            workspace_id=valid_workspace_id,
-            repository_directory=str(temp_workspace_dir),
-            item_type_in_scope=["Notebook"],
-        )
+    workspace_no_env = patched_fabric_workspace(
+        workspace_id=valid_workspace_id,
+        repository_directory=str(temp_workspace_dir),
+        item_type_in_scope=["Notebook"],
+    )
 
     # Test 2: With environment parameter (PPE)
-    with patch.object(FabricWorkspace, "_refresh_repository_items"):
-        workspace_with_env = patched_fabric_workspace(
-            workspace_id=valid_workspace_id,
-            repository_directory=str(temp_workspace_dir),
-            item_type_in_scope=["Notebook"],
-            environment="PPE",
-        )
+    workspace_with_env = patched_fabric_workspace(
+        workspace_id=valid_workspace_id,
+        repository_directory=str(temp_workspace_dir),
+        item_type_in_scope=["Notebook"],
+        environment="PPE",
+    )
 
     # Create test objects for parameter replacement
     test_item = Item(type="Notebook", name="Test Notebook", description="", guid="test-guid", path=notebook_dir)
@@ -601,6 +601,7 @@ find_replace:
     assert "ppe-replacement-value" in replaced_content_with_env, "Replacement should occur with matching environment"
 
 
+@pytest.mark.usefixtures("skip_repository_items_refresh")
 def test_environment_parameter_replacement_ignore_case(
     patched_fabric_workspace, temp_workspace_dir, valid_workspace_id
 ):
@@ -615,7 +616,7 @@ find_replace:
 """
 
     notebook_dir = temp_workspace_dir / "Test Notebook.Notebook"
-    notebook_dir.mkdir(parents=True)
+    notebook_dir.mkdir()
 
     # Content has different casing than find_value
     notebook_content = 'server = "MYDEVSERVER"\nbackup = "mydevserver"'
@@ -626,13 +627,12 @@ find_replace:
     from fabric_cicd._common._file import File
     from fabric_cicd._common._item import Item
 
-    with patch.object(FabricWorkspace, "_refresh_repository_items"):
-        workspace = patched_fabric_workspace(
-            workspace_id=valid_workspace_id,
-            repository_directory=str(temp_workspace_dir),
-            item_type_in_scope=["Notebook"],
-            environment="PPE",
-        )
+    workspace = patched_fabric_workspace(
+        workspace_id=valid_workspace_id,
+        repository_directory=str(temp_workspace_dir),
+        item_type_in_scope=["Notebook"],
+        environment="PPE",
+    )
 
     test_item = Item(type="Notebook", name="Test Notebook", description="", guid="test-guid", path=notebook_dir)
     test_file = File(item_path=notebook_dir, file_path=notebook_dir / "notebook-content.py")
@@ -645,6 +645,7 @@ find_replace:
     assert result.count("my-ppe-server") == 2
 
 
+@pytest.mark.usefixtures("skip_repository_items_refresh")
 def test_environment_parameter_replacement_ignore_case_regex(
     patched_fabric_workspace, temp_workspace_dir, valid_workspace_id
 ):
@@ -659,7 +660,7 @@ find_replace:
 """
 
     notebook_dir = temp_workspace_dir / "Test Notebook.Notebook"
-    notebook_dir.mkdir(parents=True)
+    notebook_dir.mkdir()
 
     # Content has different casing than regex pattern
     notebook_content = 'SERVER_NAME="dev-server.database.windows.net"'
@@ -670,13 +671,12 @@ find_replace:
     from fabric_cicd._common._file import File
     from fabric_cicd._common._item import Item
 
-    with patch.object(FabricWorkspace, "_refresh_repository_items"):
-        workspace = patched_fabric_workspace(
-            workspace_id=valid_workspace_id,
-            repository_directory=str(temp_workspace_dir),
-            item_type_in_scope=["Notebook"],
-            environment="PPE",
-        )
+    workspace = patched_fabric_workspace(
+        workspace_id=valid_workspace_id,
+        repository_directory=str(temp_workspace_dir),
+        item_type_in_scope=["Notebook"],
+        environment="PPE",
+    )
 
     test_item = Item(type="Notebook", name="Test Notebook", description="", guid="test-guid", path=notebook_dir)
     test_file = File(item_path=notebook_dir, file_path=notebook_dir / "notebook-content.py")
@@ -693,25 +693,13 @@ def test_empty_logical_id_validation(temp_workspace_dir, patched_fabric_workspac
     from fabric_cicd._common._exceptions import ParsingError
 
     # Create a .platform file with empty logical ID
-    item_dir = temp_workspace_dir / "TestItem.Notebook"
-    item_dir.mkdir(parents=True, exist_ok=True)
-    platform_file_path = item_dir / ".platform"
-
-    metadata_content = {
-        "metadata": {
-            "type": "Notebook",
-            "displayName": "Test Item with Empty Logical ID",
-            "description": "Test item for empty logical ID validation",
-        },
-        "config": {"logicalId": ""},  # Empty logical ID
-    }
-
-    with platform_file_path.open("w", encoding="utf-8") as f:
-        json.dump(metadata_content, f, ensure_ascii=False)
-
-    # Create a dummy content file
-    with (item_dir / "dummy.txt").open("w", encoding="utf-8") as f:
-        f.write("Dummy file content")
+    platform_file_path = create_platform_file(
+        temp_workspace_dir / "TestItem.Notebook",
+        "Notebook",
+        "Test Item with Empty Logical ID",
+        "",
+        description="Test item for empty logical ID validation",
+    )
 
     # Test that ParsingError is raised when trying to refresh repository items
     with pytest.raises(ParsingError) as exc_info:
@@ -722,8 +710,9 @@ def test_empty_logical_id_validation(temp_workspace_dir, patched_fabric_workspac
         )
 
     # Verify the error message contains the expected information
-    assert "logicalId cannot be empty" in str(exc_info.value)
-    assert str(platform_file_path) in str(exc_info.value)
+    error_message = str(exc_info.value)
+    assert "logicalId cannot be empty" in error_message
+    assert str(platform_file_path) in error_message
 
 
 def test_whitespace_only_logical_id_validation(temp_workspace_dir, patched_fabric_workspace, valid_workspace_id):
@@ -731,25 +720,13 @@ def test_whitespace_only_logical_id_validation(temp_workspace_dir, patched_fabri
     from fabric_cicd._common._exceptions import ParsingError
 
     # Create a .platform file with whitespace-only logical ID
-    item_dir = temp_workspace_dir / "TestItem.Notebook"
-    item_dir.mkdir(parents=True, exist_ok=True)
-    platform_file_path = item_dir / ".platform"
-
-    metadata_content = {
-        "metadata": {
-            "type": "Notebook",
-            "displayName": "Test Item with Whitespace Logical ID",
-            "description": "Test item for whitespace logical ID validation",
-        },
-        "config": {"logicalId": "   "},  # Whitespace-only logical ID
-    }
-
-    with platform_file_path.open("w", encoding="utf-8") as f:
-        json.dump(metadata_content, f, ensure_ascii=False)
-
-    # Create a dummy content file
-    with (item_dir / "dummy.txt").open("w", encoding="utf-8") as f:
-        f.write("Dummy file content")
+    create_platform_file(
+        temp_workspace_dir / "TestItem.Notebook",
+        "Notebook",
+        "Test Item with Whitespace Logical ID",
+        "   ",
+        description="Test item for whitespace logical ID validation",
+    )
 
     # Test that ParsingError is raised when trying to refresh repository items
     with pytest.raises(ParsingError) as exc_info:
@@ -766,25 +743,13 @@ def test_whitespace_only_logical_id_validation(temp_workspace_dir, patched_fabri
 def test_valid_logical_id_works_correctly(temp_workspace_dir, patched_fabric_workspace, valid_workspace_id):
     """Test that valid logical IDs continue to work correctly after adding validation."""
     # Create a .platform file with valid logical ID
-    item_dir = temp_workspace_dir / "TestItem.Notebook"
-    item_dir.mkdir(parents=True, exist_ok=True)
-    platform_file_path = item_dir / ".platform"
-
-    metadata_content = {
-        "metadata": {
-            "type": "Notebook",
-            "displayName": "Test Item with Valid Logical ID",
-            "description": "Test item for valid logical ID verification",
-        },
-        "config": {"logicalId": "valid-logical-id-123"},  # Valid logical ID
-    }
-
-    with platform_file_path.open("w", encoding="utf-8") as f:
-        json.dump(metadata_content, f, ensure_ascii=False)
-
-    # Create a dummy content file
-    with (item_dir / "dummy.txt").open("w", encoding="utf-8") as f:
-        f.write("Dummy file content")
+    create_platform_file(
+        temp_workspace_dir / "TestItem.Notebook",
+        "Notebook",
+        "Test Item with Valid Logical ID",
+        "valid-logical-id-123",
+        description="Test item for valid logical ID verification",
+    )
 
     # This should work without raising any exception
     workspace = patched_fabric_workspace(
@@ -799,30 +764,51 @@ def test_valid_logical_id_works_correctly(temp_workspace_dir, patched_fabric_wor
     )
 
 
-def test_empty_logical_id_validation_during_publish(temp_workspace_dir, patched_fabric_workspace, valid_workspace_id):
-    """Test that empty logical IDs are caught during workspace initialization."""
-    from fabric_cicd._common._exceptions import ParsingError
+def test_refresh_repository_items_collects_files_for_every_item(
+    temp_workspace_dir, patched_fabric_workspace, valid_workspace_id
+):
+    """Test that item files are collected for every discovered item, including nested items."""
+    create_platform_file(temp_workspace_dir / "Sales.Notebook", "Notebook", "Sales", "logical-id-1")
+    create_platform_file(temp_workspace_dir / "Hub.Eventhouse", "Eventhouse", "Hub", "logical-id-2")
+    create_platform_file(
+        temp_workspace_dir / "Hub.Eventhouse" / ".children" / "Hub.KQLDatabase", "KQLDatabase", "Hub", "logical-id-3"
+    )
 
-    # Create a .platform file with empty logical ID
-    item_dir = temp_workspace_dir / "TestItem.Notebook"
-    item_dir.mkdir(parents=True, exist_ok=True)
-    platform_file_path = item_dir / ".platform"
+    workspace = patched_fabric_workspace(
+        workspace_id=valid_workspace_id,
+        repository_directory=str(temp_workspace_dir),
+        item_type_in_scope=["Notebook", "Eventhouse", "KQLDatabase"],
+    )
 
-    metadata_content = {
-        "metadata": {
-            "type": "Notebook",
-            "displayName": "Test Item with Empty Logical ID",
-            "description": "Test item for empty logical ID validation during publish",
-        },
-        "config": {"logicalId": ""},  # Empty logical ID
+    collected = {
+        (item_type, item.name): sorted(file.relative_path for file in item.item_files)
+        for item_type, items in workspace.repository_items.items()
+        for item in items.values()
+    }
+    assert collected == {
+        ("Notebook", "Sales"): [".platform", "dummy.txt"],
+        ("Eventhouse", "Hub"): [
+            ".children/Hub.KQLDatabase/.platform",
+            ".children/Hub.KQLDatabase/dummy.txt",
+            ".platform",
+            "dummy.txt",
+        ],
+        ("KQLDatabase", "Hub"): [".platform", "dummy.txt"],
     }
 
-    with platform_file_path.open("w", encoding="utf-8") as f:
-        json.dump(metadata_content, f, ensure_ascii=False)
 
-    # Create a dummy content file
-    with (item_dir / "dummy.txt").open("w", encoding="utf-8") as f:
-        f.write("Dummy file content")
+def test_empty_logical_id_validation_during_publish(temp_workspace_dir, patched_fabric_workspace, valid_workspace_id):
+    """Test that empty logical IDs are caught during workspace initialization."""
+    from fabric_cicd._common._exceptions import ParsingError
+
+    # Create a .platform file with empty logical ID
+    platform_file_path = create_platform_file(
+        temp_workspace_dir / "TestItem.Notebook",
+        "Notebook",
+        "Test Item with Empty Logical ID",
+        "",
+        description="Test item for empty logical ID validation during publish",
+    )
 
     # Test that ParsingError is raised during workspace initialization
     with pytest.raises(ParsingError) as exc_info:
@@ -833,8 +819,9 @@ def test_empty_logical_id_validation_during_publish(temp_workspace_dir, patched_
         )
 
     # Verify the error message contains the expected information
-    assert "logicalId cannot be empty" in str(exc_info.value)
-    assert str(platform_file_path) in str(exc_info.value)
+    error_message = str(exc_info.value)
+    assert "logicalId cannot be empty" in error_message
+    assert str(platform_file_path) in error_message
 
 
 def test_multiple_empty_logical_ids_validation(temp_workspace_dir, patched_fabric_workspace, valid_workspace_id):
@@ -846,27 +833,15 @@ def test_multiple_empty_logical_ids_validation(temp_workspace_dir, patched_fabri
     platform_file_paths = []
 
     for item_dir_name in item_dirs:
-        item_dir = temp_workspace_dir / item_dir_name
-        item_dir.mkdir(parents=True, exist_ok=True)
-        platform_file_path = item_dir / ".platform"
-        platform_file_paths.append(platform_file_path)
-
         item_type = "Notebook" if "Notebook" in item_dir_name else "Environment"
-        metadata_content = {
-            "metadata": {
-                "type": item_type,
-                "displayName": f"Test Item {item_dir_name}",
-                "description": "Test item for multiple empty logical ID validation",
-            },
-            "config": {"logicalId": ""},  # Empty logical ID
-        }
-
-        with platform_file_path.open("w", encoding="utf-8") as f:
-            json.dump(metadata_content, f, ensure_ascii=False)
-
-        # Create a dummy content file
-        with (item_dir / "dummy.txt").open("w", encoding="utf-8") as f:
-            f.write("Dummy file content")
+        platform_file_path = create_platform_file(
+            temp_workspace_dir / item_dir_name,
+            item_type,
+            f"Test Item {item_dir_name}",
+            "",
+            description="Test item for multiple empty logical ID validation",
+        )
+        platform_file_paths.append(platform_file_path)
 
     # Test that ParsingError is raised when trying to refresh repository items
     with pytest.raises(ParsingError) as exc_info:
@@ -888,25 +863,13 @@ def test_single_empty_logical_id_validation_message(temp_workspace_dir, patched_
     from fabric_cicd._common._exceptions import ParsingError
 
     # Create a .platform file with empty logical ID
-    item_dir = temp_workspace_dir / "TestItem.Notebook"
-    item_dir.mkdir(parents=True, exist_ok=True)
-    platform_file_path = item_dir / ".platform"
-
-    metadata_content = {
-        "metadata": {
-            "type": "Notebook",
-            "displayName": "Test Item with Empty Logical ID",
-            "description": "Test item for single empty logical ID validation",
-        },
-        "config": {"logicalId": ""},  # Empty logical ID
-    }
-
-    with platform_file_path.open("w", encoding="utf-8") as f:
-        json.dump(metadata_content, f, ensure_ascii=False)
-
-    # Create a dummy content file
-    with (item_dir / "dummy.txt").open("w", encoding="utf-8") as f:
-        f.write("Dummy file content")
+    platform_file_path = create_platform_file(
+        temp_workspace_dir / "TestItem.Notebook",
+        "Notebook",
+        "Test Item with Empty Logical ID",
+        "",
+        description="Test item for single empty logical ID validation",
+    )
 
     # Test that ParsingError is raised when trying to refresh repository items
     with pytest.raises(ParsingError) as exc_info:
@@ -920,33 +883,21 @@ def test_single_empty_logical_id_validation_message(temp_workspace_dir, patched_
     error_message = str(exc_info.value)
     assert "logicalId cannot be empty in " in error_message
     assert "following files:" not in error_message
-    assert str(platform_file_path) in error_message
-
-
-def test_fabric_workspace_with_none_item_types_defaults_to_all(
-    temp_workspace_dir, patched_fabric_workspace, valid_workspace_id
-):
-    """Test that FabricWorkspace works correctly when initialized with None item_type_in_scope (defaults to all available types)."""
-    # Create a sample item to test with
-    item_dir = temp_workspace_dir / "TestNotebook.Notebook"
-    item_dir.mkdir(parents=True, exist_ok=True)
-    platform_file_path = item_dir / ".platform"
-
-    metadata_content = {
-        "metadata": {
-            "type": "Notebook",
-            "displayName": "Test Notebook",
-            "description": "Test notebook for None item types test",
-        },
-        "config": {"logicalId": "test-logical-id-none"},
-    }
+    assert str(platform_file_path) in error_message
 
-    with platform_file_path.open("w", encoding="utf-8") as f:
-        json.dump(metadata_content, f, ensure_ascii=False)
 
-    # Create a dummy content file
-    with (item_dir / "dummy.txt").open("w", encoding="utf-8") as f:
-        f.write("Dummy file content")
+def test_fabric_workspace_with_none_item_types_defaults_to_all(
+    temp_workspace_dir, patched_fabric_workspace, valid_workspace_id
+):
+    """Test that FabricWorkspace works correctly when initialized with None item_type_in_scope (defaults to all available types)."""
+    # Create a sample item to test with
+    create_platform_file(
+        temp_workspace_dir / "TestNotebook.Notebook",
+        "Notebook",
+        "Test Notebook",
+        "test-logical-id-none",
+        description="Test notebook for None item types test",
+    )
 
     # Test that workspace initializes correctly with None (default behavior)
     workspace = patched_fabric_workspace(
@@ -955,10 +906,7 @@ def test_fabric_workspace_with_none_item_types_defaults_to_all(
     )
 
     # Verify that item_type_in_scope was expanded to all available types
-    import fabric_cicd.constants as constants
-
-    expected_types = list(constants.ACCEPTED_ITEM_TYPES)
-    assert set(workspace.item_type_in_scope) == set(expected_types), (
+    assert set(workspace.item_type_in_scope) == set(constants.ACCEPTED_ITEM_TYPES), (
         f"Expected all item types, got {workspace.item_type_in_scope}"
     )
 
@@ -967,51 +915,59 @@ def test_fabric_workspace_with_none_item_types_defaults_to_all(
     assert "Test Notebook" in workspace.repository_items["Notebook"]
 
 
-def test_parameter_file_path_types(temp_workspace_dir, patched_fabric_workspace, valid_workspace_id):
-    """Test different path types for parameter_file_path in FabricWorkspace."""
-
-    # Absolute path - accepted
-    param_file = temp_workspace_dir / "parameters.yml"
-    param_file.write_text("""
+_PARAMETER_FILE_PLACEHOLDER = "<parameter_file>"
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "expected_find_replace"),
+    [
+        ({"parameter_file_path": _PARAMETER_FILE_PLACEHOLDER}, True),
+        ({"parameter_file_path": _PARAMETER_FILE_PLACEHOLDER, "environment": "DEV"}, True),
+        # Relative path is resolved against the repository directory; a missing file is handled gracefully
+        ({"parameter_file_path": "relative/path/parameters.yml"}, False),
+        ({"parameter_file_path": None}, False),
+        ({}, False),
+        ({"item_type_in_scope": ["Notebook"], "environment": "PROD"}, False),
+        # Invalid type is handled by the Parameter class, leaving parameters empty
+        ({"parameter_file_path": 123}, False),
+    ],
+    ids=[
+        "absolute",
+        "with_environment",
+        "relative_missing",
+        "none",
+        "omitted",
+        "backward_compatibility",
+        "invalid_type",
+    ],
+)
+def test_parameter_file_path(
+    temp_workspace_dir, patched_fabric_workspace, valid_workspace_id, kwargs, expected_find_replace
+):
+    """Test the parameter_file_path argument shapes accepted by FabricWorkspace."""
+    if _PARAMETER_FILE_PLACEHOLDER in kwargs.values():
+        param_file = temp_workspace_dir / "parameters.yml"
+        param_file.write_text("""
 find_replace:
   - find_value: "test-value"
     replace_value:
       DEV: "dev-replacement"
+      PROD: "prod-replacement"
 """)
+        kwargs = {k: str(param_file) if v == _PARAMETER_FILE_PLACEHOLDER else v for k, v in kwargs.items()}
 
     workspace = patched_fabric_workspace(
         workspace_id=valid_workspace_id,
         repository_directory=str(temp_workspace_dir),
-        parameter_file_path=str(param_file),
-    )
-
-    assert workspace.parameter_file_path == str(param_file)
-
-    # Relative path - now resolved against repository directory but file doesn't exist
-    # This should not raise an exception now, it's handled gracefully
-    workspace = patched_fabric_workspace(
-        workspace_id=valid_workspace_id,
-        repository_directory=str(temp_workspace_dir),
-        parameter_file_path="relative/path/parameters.yml",
-    )
-
-    # The workspace should be created successfully but with empty parameters
-    assert workspace is not None
-    assert hasattr(workspace, "environment_parameter")
-    assert not workspace.environment_parameter
-
-
-def test_parameter_file_path_none(temp_workspace_dir, patched_fabric_workspace, valid_workspace_id):
-    """Test None cases for parameter_file_path in FabricWorkspace."""
-    # Create a workspace with parameter_file_path set to None
-    workspace = patched_fabric_workspace(
-        workspace_id=valid_workspace_id, repository_directory=str(temp_workspace_dir), parameter_file_path=None
+        **kwargs,
     )
-    assert workspace.parameter_file_path is None
 
-    # Create a workspace without parameter_file_path provided
-    workspace = patched_fabric_workspace(workspace_id=valid_workspace_id, repository_directory=str(temp_workspace_dir))
-    assert workspace.parameter_file_path is None
+    assert workspace.parameter_file_path == kwargs.get("parameter_file_path")
+    if "environment" in kwargs:
+        assert workspace.environment == kwargs["environment"]
+    if "item_type_in_scope" in kwargs:
+        assert workspace.item_type_in_scope == kwargs["item_type_in_scope"]
+    assert ("find_replace" in workspace.environment_parameter) is expected_find_replace
 
 
 def test_skip_parameterization_prevents_parameter_yml_auto_discovery(
@@ -1055,117 +1011,34 @@ def test_skip_parameterization_false_loads_explicit_parameter_file(
     assert "find_replace" in workspace.environment_parameter
 
 
-def test_parameter_file_path_with_environment(temp_workspace_dir, patched_fabric_workspace, valid_workspace_id):
-    """Test that FabricWorkspace works with both parameter_file_path and environment."""
-    param_file = temp_workspace_dir / "dev_parameters.yml"
-    param_file.write_text("""
-find_replace:
-  - find_value: "test-value"
-    replace_value:
-      DEV: "dev-replacement"
-""")
-
-    workspace = patched_fabric_workspace(
-        workspace_id=valid_workspace_id,
-        repository_directory=str(temp_workspace_dir),
-        parameter_file_path=str(param_file),
-        environment="DEV",
-    )
-
-    assert workspace.parameter_file_path == str(param_file)
-    assert workspace.environment == "DEV"
-
-
-def test_parameter_file_path_backward_compatibility(temp_workspace_dir, patched_fabric_workspace, valid_workspace_id):
-    """Test that existing code without parameter_file_path continues to work."""
-    workspace = patched_fabric_workspace(
-        workspace_id=valid_workspace_id,
-        repository_directory=str(temp_workspace_dir),
-        item_type_in_scope=["Notebook"],
-        environment="PROD",
-    )
-
-    # Should work as before without parameter_file_path
-    assert workspace.parameter_file_path is None
-    assert workspace.environment == "PROD"
-    assert workspace.item_type_in_scope == ["Notebook"]
-
-
-def test_parameter_file_path_integration_with_parameter_class(
-    temp_workspace_dir, patched_fabric_workspace, valid_workspace_id
-):
-    """Test that parameter_file_path integrates correctly with Parameter class."""
-    param_file = temp_workspace_dir / "test_parameters.yml"
-    param_content = """
-find_replace:
-  - find_value: "test-value"
-    replace_value:
-      DEV: "dev-replacement"
-      PROD: "prod-replacement"
-"""
-    param_file.write_text(param_content)
-
-    workspace = patched_fabric_workspace(
-        workspace_id=valid_workspace_id,
-        repository_directory=str(temp_workspace_dir),
-        parameter_file_path=str(param_file),
-        environment="DEV",
-    )
-
-    # The workspace should use the parameter file path
-    assert workspace.parameter_file_path == str(param_file)
-
-    # The parameter data should be loaded correctly
-    # (Note: This is testing the integration, actual Parameter behavior tested separately)
-    assert hasattr(workspace, "environment_parameter")
-    assert "find_replace" in workspace.environment_parameter
-
-
-def test_parameter_file_path_invalid_type_rejected(temp_workspace_dir, patched_fabric_workspace, valid_workspace_id):
-    """Test that FabricWorkspace handles invalid types for parameter_file_path."""
-    # This should not raise an exception now since Parameter handles the error internally
-    workspace = patched_fabric_workspace(
-        workspace_id=valid_workspace_id,
-        repository_directory=str(temp_workspace_dir),
-        parameter_file_path=123,  # Invalid type
-    )
-
-    # The workspace should be created, but parameter loading should fail silently
-    assert workspace is not None
-    assert hasattr(workspace, "environment_parameter")
-    # Environment parameter should be empty since the parameter file path was invalid
-    assert not workspace.environment_parameter
-
-
-def test_no_token_credential_raises_error(temp_workspace_dir, valid_workspace_id):
+def test_no_token_credential_raises_error(tmp_path, valid_workspace_id):
     """Test that constructing FabricWorkspace without token_credential raises TypeError."""
 
     # Create a simple platform file so directory validation passes
-    notebook_dir = temp_workspace_dir / "Test Notebook"
+    notebook_dir = tmp_path / "Test Notebook"
     notebook_dir.mkdir()
     platform_file = notebook_dir / ".platform"
     platform_content = {
         "metadata": {"type": "Notebook", "displayName": "Test Notebook"},
         "config": {"logicalId": "12345678-1234-5678-abcd-1234567890ab"},
     }
-    with platform_file.open("w", encoding="utf-8") as f:
-        json.dump(platform_content, f)
+    platform_file.write_text(json.dumps(platform_content), encoding="utf-8")
 
     with pytest.raises(TypeError) as exc_info:
         FabricWorkspace(
             workspace_id=valid_workspace_id,
-            repository_directory=str(temp_workspace_dir),
+            repository_directory=str(tmp_path),
         )
 
     assert "token_credential" in str(exc_info.value)
 
 
-def test_base_api_url_kwarg_raises_error(temp_workspace_dir, valid_workspace_id):
+def test_base_api_url_kwarg_raises_error(tmp_path, valid_workspace_id):
     """Test that passing base_api_url as kwarg raises an error."""
     from fabric_cicd._common._exceptions import InputError
 
     # Create a simple platform file
-    notebook_dir = temp_workspace_dir / "Test Notebook"
+    notebook_dir = tmp_path / "Test Notebook"
     notebook_dir.mkdir()
     platform_file = notebook_dir / ".platform"
     platform_content = {
@@ -1174,68 +1047,65 @@ def test_base_api_url_kwarg_raises_error(temp_workspace_dir, valid_workspace_id)
         "config": {"version": "2.0", "logicalId": "12345678-1234-5678-abcd-1234567890ab"},
     }
 
-    with platform_file.open("w", encoding="utf-8") as f:
-        json.dump(platform_content, f)
+    platform_file.write_text(json.dumps(platform_content), encoding="utf-8")
 
     # Test that base_api_url kwarg raises InputError
     with patch("fabric_cicd.fabric_workspace.FabricEndpoint"):
         with pytest.raises(InputError) as exc_info:
             FabricWorkspace(
                 workspace_id=valid_workspace_id,
-                repository_directory=str(temp_workspace_dir),
+                repository_directory=str(tmp_path),
                 base_api_url="https://custom.api.url",
                 token_credential=DummyTokenCredential(),
             )
 
         # Verify the error message contains the expected text
-        assert "base_api_url is no longer supported" in str(exc_info.value)
-        assert "constants.DEFAULT_API_ROOT_URL" in str(exc_info.value)
+        error_message = str(exc_info.value)
+        assert "base_api_url is no longer supported" in error_message
+        assert "constants.DEFAULT_API_ROOT_URL" in error_message
 
 
-def test_resolve_workspace_name(patched_fabric_workspace, valid_workspace_id, temp_workspace_dir):
+def test_resolve_workspace_name(
+    patched_fabric_workspace, valid_workspace_id, empty_workspace_dir, mock_fabric_endpoint
+):
     """Tests _resolve_workspace_name resolves display name from workspace ID."""
-    mock_endpoint = MagicMock()
-    mock_endpoint.invoke.return_value = {
+    mock_fabric_endpoint.response = {
         "body": {
             "id": "mock-workspace-id",
             "displayName": "My Workspace [DEV]",
         }
     }
 
-    with patch("fabric_cicd.fabric_workspace.FabricEndpoint", return_value=mock_endpoint):
-        workspace = patched_fabric_workspace(
-            workspace_id=valid_workspace_id,
-            repository_directory=str(temp_workspace_dir),
-        )
+    workspace = patched_fabric_workspace(
+        workspace_id=valid_workspace_id,
+        repository_directory=str(empty_workspace_dir),
+    )
 
-    workspace.endpoint = mock_endpoint
+    workspace.endpoint = mock_fabric_endpoint
     result = workspace._resolve_workspace_name()
     assert result == "My Workspace [DEV]"
 
 
-def test_resolve_workspace_name_not_found(patched_fabric_workspace, valid_workspace_id, temp_workspace_dir):
+def test_resolve_workspace_name_not_found(
+    patched_fabric_workspace, valid_workspace_id, empty_workspace_dir, mock_fabric_endpoint
+):
     """Tests _resolve_workspace_name raises InputError when displayName not in response."""
     from fabric_cicd._common._exceptions import InputError
 
-    mock_endpoint = MagicMock()
-    mock_endpoint.invoke.return_value = {"body": {}}
+    mock_fabric_endpoint.response = {"body": {}}
 
-    with patch("fabric_cicd.fabric_workspace.FabricEndpoint", return_value=mock_endpoint):
-        workspace = patched_fabric_workspace(
-            workspace_id=valid_workspace_id,
-            repository_directory=str(temp_workspace_dir),
-        )
+    workspace = patched_fabric_workspace(
+        workspace_id=valid_workspace_id,
+        repository_directory=str(empty_workspace_dir),
+    )
 
-    workspace.endpoint = mock_endpoint
+    workspace.endpoint = mock_fabric_endpoint
     with pytest.raises(InputError, match="Workspace name could not be resolved from workspace ID"):
         workspace._resolve_workspace_name()
 
 
-def test_lookup_item_attribute(patched_fabric_workspace, valid_workspace_id, temp_workspace_dir):
+def test_lookup_item_attribute(patched_fabric_workspace, valid_workspace_id, empty_workspace_dir, mock_fabric_endpoint):
     """Test that _lookup_item_attribute correctly finds items in another workspace."""
-    # Mock endpoint response for workspace items
-    mock_endpoint = MagicMock()
-
     # Ensure the mock response exactly matches what's expected
     mock_response = {
         "body": {
@@ -1245,123 +1115,104 @@ def test_lookup_item_attribute(patched_fabric_workspace, valid_workspace_id, tem
             ]
         }
     }
-    mock_endpoint.invoke.return_value = mock_response
+    mock_fabric_endpoint.response = mock_response
 
     # Create a workspace with our mocked endpoint
-    with patch("fabric_cicd.fabric_workspace.FabricEndpoint", return_value=mock_endpoint):
-        workspace = patched_fabric_workspace(
-            workspace_id=valid_workspace_id,
-            repository_directory=str(temp_workspace_dir),
-            item_type_in_scope=["Notebook", "DataPipeline"],
-        )
-
-        # Replace the endpoint attribute to ensure our mock is being used
-        workspace.endpoint = mock_endpoint
-
-        # Test finding an existing item
-        item_id = workspace._lookup_item_attribute("target-workspace-id", "Notebook", "Test Notebook", "id")
-        assert item_id == "item-id-1234"
-
-        # Test API was called with correct parameters
-        mock_endpoint.invoke.assert_called_with(
-            method="GET", url=f"{constants.DEFAULT_API_ROOT_URL}/v1/workspaces/target-workspace-id/items"
-        )
+    workspace = patched_fabric_workspace(
+        workspace_id=valid_workspace_id,
+        repository_directory=str(empty_workspace_dir),
+        item_type_in_scope=["Notebook", "DataPipeline"],
+    )
 
-        # Test finding a different item type
-        item_id = workspace._lookup_item_attribute("target-workspace-id", "DataPipeline", "Test Pipeline", "id")
-        assert item_id == "item-id-5678"
+    # Replace the endpoint attribute to ensure our mock is being used
+    workspace.endpoint = mock_fabric_endpoint
 
-        # Test item not found - should raise InputError
-        from fabric_cicd._common._exceptions import InputError
+    # Test finding an existing item
+    item_id = workspace._lookup_item_attribute("target-workspace-id", "Notebook", "Test Notebook", "id")
+    assert item_id == "item-id-1234"
 
-        with pytest.raises(InputError) as exc_info:
-            workspace._lookup_item_attribute("target-workspace-id", "Notebook", "Non-Existent Notebook", "id")
+    # Test API was called with correct parameters
+    assert mock_fabric_endpoint.calls[-1] == {"method": "GET", "url": TARGET_WORKSPACE_ITEMS_URL}
 
-        assert "Failed to look up item in workspace" in str(exc_info.value)
-        assert "target-workspace-id" in str(exc_info.value)
-        assert "Notebook" in str(exc_info.value)
-        assert "Non-Existent Notebook" in str(exc_info.value)
+    # Test finding a different item type
+    item_id = workspace._lookup_item_attribute("target-workspace-id", "DataPipeline", "Test Pipeline", "id")
+    assert item_id == "item-id-5678"
 
-        # Test item type not found - should raise InputError
-        with pytest.raises(InputError) as exc_info:
-            workspace._lookup_item_attribute("target-workspace-id", "NonExistentType", "Test Item", "id")
-
-        assert "Failed to look up item in workspace" in str(exc_info.value)
-        assert "target-workspace-id" in str(exc_info.value)
-        assert "NonExistentType" in str(exc_info.value)
-        assert "Test Item" in str(exc_info.value)
-
-
-def test_kqldatabase_folder_regex_root_eventhouse():
-    """KQLDatabase under top-level Eventhouse .children: group(1) is empty string."""
-    pattern = re.compile(constants.KQL_DATABASE_FOLDER_PATH_REGEX)
-    relative_path = "/SampleEventhouse.Eventhouse/.children/TaxiDB.KQLDatabase"
-    match = pattern.match(relative_path)
-    assert match is not None, "Regex should match a top-level Eventhouse .children path"
-    assert match.group(1) == "", "Expected empty string for group(1) when Eventhouse is at repository root"
-
-
-def test_kqldatabase_folder_regex_nested_subfolder():
-    """KQLDatabase nested under a subfolder before Eventhouse: group(1) captures the subfolder path."""
-    pattern = re.compile(constants.KQL_DATABASE_FOLDER_PATH_REGEX)
-    relative_path = "/subfolder/EventhouseName.Eventhouse/.children/DB.KQLDatabase"
-    match = pattern.match(relative_path)
-    assert match is not None, "Regex should match nested Eventhouse .children path"
-    assert match.group(1) == "/subfolder", "Expected '/subfolder' captured as the parent path"
-
-
-def test_kqldatabase_folder_regex_no_match_edge_case():
-    """Edge case: paths that do not follow the Eventhouse/.children pattern should not match."""
-    pattern = re.compile(constants.KQL_DATABASE_FOLDER_PATH_REGEX)
-    # Missing '.Eventhouse/.children' sequence
-    bad_paths = [
-        "/SomeFolder/TaxiDB.KQLDatabase",  # no Eventhouse container
-        "/Another.Eventhouse/TaxiDB.KQLDatabase",  # missing '.children'
-        "/prefix/.children/TaxiDB.KQLDatabase",  # missing Eventhouse segment
-    ]
-    for p in bad_paths:
-        assert pattern.match(p) is None, f"Regex should not match path: {p}"
+    # Test item not found - should raise InputError
+    from fabric_cicd._common._exceptions import InputError
 
+    with pytest.raises(
+        InputError,
+        match="Failed to look up item in workspace: target-workspace-id, item_type: Notebook, item_name: Non-Existent Notebook",
+    ):
+        workspace._lookup_item_attribute("target-workspace-id", "Notebook", "Non-Existent Notebook", "id")
 
-def test_get_item_attribute_caching_basic(patched_fabric_workspace, valid_workspace_id, temp_workspace_dir):
+    # Test item type not found - should raise InputError
+    with pytest.raises(
+        InputError,
+        match="Failed to look up item in workspace: target-workspace-id, item_type: NonExistentType, item_name: Test Item",
+    ):
+        workspace._lookup_item_attribute("target-workspace-id", "NonExistentType", "Test Item", "id")
+
+
+@pytest.mark.parametrize(
+    ("relative_path", "expected_group"),
+    [
+        ("/SampleEventhouse.Eventhouse/.children/TaxiDB.KQLDatabase", ""),
+        ("/subfolder/EventhouseName.Eventhouse/.children/DB.KQLDatabase", "/subfolder"),
+        ("/SomeFolder/TaxiDB.KQLDatabase", None),
+        ("/Another.Eventhouse/TaxiDB.KQLDatabase", None),
+        ("/prefix/.children/TaxiDB.KQLDatabase", None),
+    ],
+    ids=["root_eventhouse", "nested_subfolder", "no_eventhouse", "missing_children", "missing_eventhouse"],
+)
+def test_kqldatabase_folder_regex(relative_path, expected_group):
+    """KQLDatabase folder regex captures the Eventhouse parent path, and rejects paths outside Eventhouse/.children."""
+    match = re.match(constants.KQL_DATABASE_FOLDER_PATH_REGEX, relative_path)
+    if expected_group is None:
+        assert match is None, f"Regex should not match path: {relative_path}"
+    else:
+        assert match is not None, f"Regex should match path: {relative_path}"
+        assert match.group(1) == expected_group
+
+
+def test_get_item_attribute_caching_basic(
+    patched_fabric_workspace, valid_workspace_id, empty_workspace_dir, mock_fabric_endpoint
+):
     """Test that _get_item_attribute caches results and returns expected values."""
-    mock_endpoint = MagicMock()
 
     # Mock response for Lakehouse sqlendpoint attribute
     mock_response = {"body": {"properties": {"sqlEndpointProperties": {"connectionString": "test-connection-string"}}}}
-    mock_endpoint.invoke.return_value = mock_response
+    mock_fabric_endpoint.response = mock_response
 
     # Create workspace with mocked endpoint
-    with patch("fabric_cicd.fabric_workspace.FabricEndpoint", return_value=mock_endpoint):
-        workspace = patched_fabric_workspace(
-            workspace_id=valid_workspace_id,
-            repository_directory=str(temp_workspace_dir),
-        )
-        workspace.endpoint = mock_endpoint
-
-        # Test fetching an attribute
-        result = workspace._get_item_attribute(
-            workspace_id="test-workspace-id",
-            item_type="Lakehouse",
-            item_guid="test-item-guid",
-            item_name="Test Lakehouse",
-            attribute_name="sqlendpoint",
-        )
+    workspace = patched_fabric_workspace(
+        workspace_id=valid_workspace_id,
+        repository_directory=str(empty_workspace_dir),
+    )
+    workspace.endpoint = mock_fabric_endpoint
+
+    # Test fetching an attribute
+    result = workspace._get_item_attribute(
+        workspace_id="test-workspace-id",
+        item_type="Lakehouse",
+        item_guid="test-item-guid",
+        item_name="Test Lakehouse",
+        attribute_name="sqlendpoint",
+    )
 
-        # Verify the result is as expected
-        assert result == "test-connection-string"
+    # Verify the result is as expected
+    assert result == "test-connection-string"
 
-        # Verify API was called once
-        assert mock_endpoint.invoke.call_count == 1
-        mock_endpoint.invoke.assert_called_with(
-            method="GET",
-            url=f"{constants.DEFAULT_API_ROOT_URL}/v1/workspaces/test-workspace-id/lakehouses/test-item-guid",
-        )
+    # Verify API was called once
+    assert len(mock_fabric_endpoint.calls) == 1
+    assert mock_fabric_endpoint.calls[-1] == {"method": "GET", "url": TEST_LAKEHOUSE_URL}
 
 
-def test_get_item_attribute_mirrored_database(patched_fabric_workspace, valid_workspace_id, temp_workspace_dir):
+def test_get_item_attribute_mirrored_database(
+    patched_fabric_workspace, valid_workspace_id, empty_workspace_dir, mock_fabric_endpoint
+):
     """Test that _get_item_attribute resolves sqlendpoint and sqlendpointid for MirroredDatabase items."""
-    mock_endpoint = MagicMock()
 
     # Mock response mirrors the Fabric "Get Mirrored Database" API shape
     mock_response = {
@@ -1374,219 +1225,204 @@ def test_get_item_attribute_mirrored_database(patched_fabric_workspace, valid_wo
             }
         }
     }
-    mock_endpoint.invoke.return_value = mock_response
+    mock_fabric_endpoint.response = mock_response
 
-    with patch("fabric_cicd.fabric_workspace.FabricEndpoint", return_value=mock_endpoint):
-        workspace = patched_fabric_workspace(
-            workspace_id=valid_workspace_id,
-            repository_directory=str(temp_workspace_dir),
-        )
-        workspace.endpoint = mock_endpoint
-
-        sqlendpoint = workspace._get_item_attribute(
-            workspace_id="test-workspace-id",
-            item_type="MirroredDatabase",
-            item_guid="test-item-guid",
-            item_name="Test Mirrored Database",
-            attribute_name="sqlendpoint",
-        )
-        sqlendpointid = workspace._get_item_attribute(
-            workspace_id="test-workspace-id",
-            item_type="MirroredDatabase",
-            item_guid="test-item-guid",
-            item_name="Test Mirrored Database",
-            attribute_name="sqlendpointid",
-        )
+    workspace = patched_fabric_workspace(
+        workspace_id=valid_workspace_id,
+        repository_directory=str(empty_workspace_dir),
+    )
+    workspace.endpoint = mock_fabric_endpoint
+
+    sqlendpoint = workspace._get_item_attribute(
+        workspace_id="test-workspace-id",
+        item_type="MirroredDatabase",
+        item_guid="test-item-guid",
+        item_name="Test Mirrored Database",
+        attribute_name="sqlendpoint",
+    )
+    sqlendpointid = workspace._get_item_attribute(
+        workspace_id="test-workspace-id",
+        item_type="MirroredDatabase",
+        item_guid="test-item-guid",
+        item_name="Test Mirrored Database",
+        attribute_name="sqlendpointid",
+    )
 
-        # Both attributes resolve from the mirrored database's sqlEndpointProperties
-        assert sqlendpoint == "mirrored-connection-string"
-        assert sqlendpointid == "mirrored-endpoint-id"
+    # Both attributes resolve from the mirrored database's sqlEndpointProperties
+    assert sqlendpoint == "mirrored-connection-string"
+    assert sqlendpointid == "mirrored-endpoint-id"
 
-        # Endpoint is queried via the (case-insensitive) mirroreddatabases collection segment
-        mock_endpoint.invoke.assert_called_with(
-            method="GET",
-            url=f"{constants.DEFAULT_API_ROOT_URL}/v1/workspaces/test-workspace-id/mirroreddatabases/test-item-guid",
-        )
+    # Endpoint is queried via the (case-insensitive) mirroreddatabases collection segment
+    assert mock_fabric_endpoint.calls[-1] == {"method": "GET", "url": TEST_MIRRORED_DATABASE_URL}
 
 
-def test_get_item_attribute_caching_prevents_api_call(patched_fabric_workspace, valid_workspace_id, temp_workspace_dir):
+def test_get_item_attribute_caching_prevents_api_call(
+    patched_fabric_workspace, valid_workspace_id, empty_workspace_dir, mock_fabric_endpoint
+):
     """Test that fetching the same attribute again uses cache and doesn't make API call."""
-    mock_endpoint = MagicMock()
 
     # Mock response for Lakehouse sqlendpoint attribute
     mock_response = {"body": {"properties": {"sqlEndpointProperties": {"connectionString": "test-connection-string"}}}}
-    mock_endpoint.invoke.return_value = mock_response
+    mock_fabric_endpoint.response = mock_response
 
     # Create workspace with mocked endpoint
-    with patch("fabric_cicd.fabric_workspace.FabricEndpoint", return_value=mock_endpoint):
-        workspace = patched_fabric_workspace(
-            workspace_id=valid_workspace_id,
-            repository_directory=str(temp_workspace_dir),
-        )
-        workspace.endpoint = mock_endpoint
-
-        # First call - should make API call
-        result1 = workspace._get_item_attribute(
-            workspace_id="test-workspace-id",
-            item_type="Lakehouse",
-            item_guid="test-item-guid",
-            item_name="Test Lakehouse",
-            attribute_name="sqlendpoint",
-        )
+    workspace = patched_fabric_workspace(
+        workspace_id=valid_workspace_id,
+        repository_directory=str(empty_workspace_dir),
+    )
+    workspace.endpoint = mock_fabric_endpoint
+
+    # First call - should make API call
+    result1 = workspace._get_item_attribute(
+        workspace_id="test-workspace-id",
+        item_type="Lakehouse",
+        item_guid="test-item-guid",
+        item_name="Test Lakehouse",
+        attribute_name="sqlendpoint",
+    )
 
-        # Second call with same parameters - should use cache
-        result2 = workspace._get_item_attribute(
-            workspace_id="test-workspace-id",
-            item_type="Lakehouse",
-            item_guid="test-item-guid",
-            item_name="Test Lakehouse",
-            attribute_name="sqlendpoint",
-        )
+    # Second call with same parameters - should use cache
+    result2 = workspace._get_item_attribute(
+        workspace_id="test-workspace-id",
+        item_type="Lakehouse",
+        item_guid="test-item-guid",
+        item_name="Test Lakehouse",
+        attribute_name="sqlendpoint",
+    )
 
-        # Verify results are the same
-        assert result1 == result2 == "test-connection-string"
+    # Verify results are the same
+    assert result1 == result2 == "test-connection-string"
 
-        # Verify API was called only once (cached on second call)
-        assert mock_endpoint.invoke.call_count == 1
+    # Verify API was called only once (cached on second call)
+    assert len(mock_fabric_endpoint.calls) == 1
 
 
-def test_get_item_attribute_different_cache_keys(patched_fabric_workspace, valid_workspace_id, temp_workspace_dir):
+def test_get_item_attribute_different_cache_keys(
+    patched_fabric_workspace, valid_workspace_id, empty_workspace_dir, mock_fabric_endpoint
+):
     """Test that different cache keys don't collide and each makes separate API calls."""
-    mock_endpoint = MagicMock()
 
-    # Mock response for different item types
-    def mock_invoke_side_effect(*args, **kwargs):
-        url = kwargs.get("url", args[1] if len(args) > 1 else "")
-        if "lakehouses" in url:
-            return {
-                "body": {
-                    "properties": {
-                        "sqlEndpointProperties": {
-                            "id": "endpoint-id-123",
-                            "connectionString": "lakehouse-connection-string",
-                        }
+    # Mock response for different item types, keyed by the item collection segment of the URL
+    responses = {
+        "lakehouses": {
+            "body": {
+                "properties": {
+                    "sqlEndpointProperties": {
+                        "id": "endpoint-id-123",
+                        "connectionString": "lakehouse-connection-string",
                     }
                 }
             }
-        if "warehouses" in url:
-            return {"body": {"properties": {"connectionString": "warehouse-connection-string"}}}
-        if "eventhouses" in url:
-            return {"body": {"properties": {"queryServiceUri": "eventhouse-query-uri"}}}
-        return {"body": {}}
+        },
+        "warehouses": {"body": {"properties": {"connectionString": "warehouse-connection-string"}}},
+        "eventhouses": {"body": {"properties": {"queryServiceUri": "eventhouse-query-uri"}}},
+    }
+
+    def mock_invoke_side_effect(url, **_kwargs):
+        return responses.get(url.rsplit("/", 2)[-2], {"body": {}})
 
-    mock_endpoint.invoke.side_effect = mock_invoke_side_effect
+    mock_fabric_endpoint.side_effect = mock_invoke_side_effect
 
     # Create workspace with mocked endpoint
-    with patch("fabric_cicd.fabric_workspace.FabricEndpoint", return_value=mock_endpoint):
-        workspace = patched_fabric_workspace(
-            workspace_id=valid_workspace_id,
-            repository_directory=str(temp_workspace_dir),
-        )
-        workspace.endpoint = mock_endpoint
+    workspace = patched_fabric_workspace(
+        workspace_id=valid_workspace_id,
+        repository_directory=str(empty_workspace_dir),
+    )
+    workspace.endpoint = mock_fabric_endpoint
 
-        # Test different combinations to ensure no cache collisions
+    # Test different combinations to ensure no cache collisions
 
-        # Different item types
-        lakehouse_result = workspace._get_item_attribute("ws1", "Lakehouse", "guid1", "name1", "sqlendpoint")
-        warehouse_result = workspace._get_item_attribute("ws1", "Warehouse", "guid1", "name1", "sqlendpoint")
-        eventhouse_result = workspace._get_item_attribute("ws1", "Eventhouse", "guid1", "name1", "queryserviceuri")
+    # Different item types
+    lakehouse_result = workspace._get_item_attribute("ws1", "Lakehouse", "guid1", "name1", "sqlendpoint")
+    warehouse_result = workspace._get_item_attribute("ws1", "Warehouse", "guid1", "name1", "sqlendpoint")
+    eventhouse_result = workspace._get_item_attribute("ws1", "Eventhouse", "guid1", "name1", "queryserviceuri")
 
-        # Different workspace IDs
-        lakehouse_ws2_result = workspace._get_item_attribute("ws2", "Lakehouse", "guid1", "name1", "sqlendpoint")
+    # Different workspace IDs
+    lakehouse_ws2_result = workspace._get_item_attribute("ws2", "Lakehouse", "guid1", "name1", "sqlendpoint")
 
-        # Different item GUIDs
-        lakehouse_guid2_result = workspace._get_item_attribute("ws1", "Lakehouse", "guid2", "name1", "sqlendpoint")
+    # Different item GUIDs
+    lakehouse_guid2_result = workspace._get_item_attribute("ws1", "Lakehouse", "guid2", "name1", "sqlendpoint")
 
-        # Different item names
-        lakehouse_name2_result = workspace._get_item_attribute("ws1", "Lakehouse", "guid1", "name2", "sqlendpoint")
+    # Different item names
+    lakehouse_name2_result = workspace._get_item_attribute("ws1", "Lakehouse", "guid1", "name2", "sqlendpoint")
 
-        # Different attributes
-        lakehouse_sqlendpointid_result = workspace._get_item_attribute(
-            "ws1", "Lakehouse", "guid1", "name1", "sqlendpointid"
-        )
+    # Different attributes
+    lakehouse_sqlendpointid_result = workspace._get_item_attribute(
+        "ws1", "Lakehouse", "guid1", "name1", "sqlendpointid"
+    )
 
-        # Verify all results are different and correct
-        assert lakehouse_result == "lakehouse-connection-string"
-        assert warehouse_result == "warehouse-connection-string"
-        assert eventhouse_result == "eventhouse-query-uri"
-        assert lakehouse_ws2_result == "lakehouse-connection-string"  # Same API response
-        assert lakehouse_guid2_result == "lakehouse-connection-string"  # Same API response
-        assert lakehouse_name2_result == "lakehouse-connection-string"  # Same API response
-
-        # Mock the API to return different values for sqlendpointid
-        def mock_invoke_side_effect_extended(*args, **kwargs):
-            url = kwargs.get("url", args[1] if len(args) > 1 else "")
-            if "lakehouses" in url:
-                if "guid1" in url:
-                    return {
-                        "body": {
-                            "properties": {
-                                "sqlEndpointProperties": {
-                                    "id": "endpoint-id-123",
-                                    "connectionString": "lakehouse-connection-string",
-                                }
-                            }
-                        }
-                    }
-                # guid2
-                return {
-                    "body": {
-                        "properties": {
-                            "sqlEndpointProperties": {
-                                "id": "endpoint-id-456",
-                                "connectionString": "lakehouse-connection-string-2",
-                            }
-                        }
+    # Verify all results are different and correct
+    assert lakehouse_result == "lakehouse-connection-string"
+    assert warehouse_result == "warehouse-connection-string"
+    assert eventhouse_result == "eventhouse-query-uri"
+    assert lakehouse_ws2_result == "lakehouse-connection-string"  # Same API response
+    assert lakehouse_guid2_result == "lakehouse-connection-string"  # Same API response
+    assert lakehouse_name2_result == "lakehouse-connection-string"  # Same API response
+
+    # Mock the API to return different values for sqlendpointid, keyed by (item collection, item guid)
+    routes = {
+        ("lakehouses", "guid1"): responses["lakehouses"],
+        ("lakehouses", "guid2"): {
+            "body": {
+                "properties": {
+                    "sqlEndpointProperties": {
+                        "id": "endpoint-id-456",
+                        "connectionString": "lakehouse-connection-string-2",
                     }
                 }
-            return {"body": {}}
+            }
+        },
+    }
 
-        mock_endpoint.invoke.side_effect = mock_invoke_side_effect_extended
+    def mock_invoke_side_effect_extended(url, **_kwargs):
+        return routes.get(tuple(url.rsplit("/", 2)[-2:]), {"body": {}})
 
-        # Fetch sqlendpointid for guid1
-        lakehouse_sqlendpointid_result = workspace._get_item_attribute(
-            "ws1", "Lakehouse", "guid1", "name1", "sqlendpointid"
-        )
-        assert lakehouse_sqlendpointid_result == "endpoint-id-123"
+    mock_fabric_endpoint.side_effect = mock_invoke_side_effect_extended
+
+    # Fetch sqlendpointid for guid1
+    lakehouse_sqlendpointid_result = workspace._get_item_attribute(
+        "ws1", "Lakehouse", "guid1", "name1", "sqlendpointid"
+    )
+    assert lakehouse_sqlendpointid_result == "endpoint-id-123"
 
-        # Verify API was called for each unique cache key
-        # We expect 7 calls: 3 initial + 1 for ws2 + 1 for guid2 + 1 for name2 + 1 for sqlendpointid
-        assert mock_endpoint.invoke.call_count == 7
+    # Verify API was called for each unique cache key
+    # We expect 7 calls: 3 initial + 1 for ws2 + 1 for guid2 + 1 for name2 + 1 for sqlendpointid
+    assert len(mock_fabric_endpoint.calls) == 7
 
 
-def test_get_item_attribute_edge_cases(patched_fabric_workspace, valid_workspace_id, temp_workspace_dir):
+def test_get_item_attribute_edge_cases(
+    patched_fabric_workspace, valid_workspace_id, empty_workspace_dir, mock_fabric_endpoint
+):
     """Test edge cases for _get_item_attribute to ensure cache doesn't introduce regressions."""
-    mock_endpoint = MagicMock()
-    mock_endpoint.invoke.return_value = {"body": {}}
+    mock_fabric_endpoint.response = {"body": {}}
 
     # Create workspace with mocked endpoint
-    with patch("fabric_cicd.fabric_workspace.FabricEndpoint", return_value=mock_endpoint):
-        workspace = patched_fabric_workspace(
-            workspace_id=valid_workspace_id,
-            repository_directory=str(temp_workspace_dir),
-        )
-        workspace.endpoint = mock_endpoint
+    workspace = patched_fabric_workspace(
+        workspace_id=valid_workspace_id,
+        repository_directory=str(empty_workspace_dir),
+    )
+    workspace.endpoint = mock_fabric_endpoint
 
-        # Test empty item_guid - should return empty string without API call
-        result = workspace._get_item_attribute("ws1", "Lakehouse", "", "name1", "sqlendpoint")
-        assert result == ""
-        assert mock_endpoint.invoke.call_count == 0  # No API call made
+    # Test empty item_guid - should return empty string without API call
+    result = workspace._get_item_attribute("ws1", "Lakehouse", "", "name1", "sqlendpoint")
+    assert result == ""
+    assert len(mock_fabric_endpoint.calls) == 0  # No API call made
 
-        # Test None item_guid - should return empty string without API call
-        result = workspace._get_item_attribute("ws1", "Lakehouse", None, "name1", "sqlendpoint")
-        assert result == ""
-        assert mock_endpoint.invoke.call_count == 0  # No API call made
+    # Test None item_guid - should return empty string without API call
+    result = workspace._get_item_attribute("ws1", "Lakehouse", None, "name1", "sqlendpoint")
+    assert result == ""
+    assert len(mock_fabric_endpoint.calls) == 0  # No API call made
 
-        # Test unsupported item type - should return empty string without API call
-        result = workspace._get_item_attribute("ws1", "UnsupportedType", "guid1", "name1", "someattr")
-        assert result == ""
-        assert mock_endpoint.invoke.call_count == 0  # No API call made
+    # Test unsupported item type - should return empty string without API call
+    result = workspace._get_item_attribute("ws1", "UnsupportedType", "guid1", "name1", "someattr")
+    assert result == ""
+    assert len(mock_fabric_endpoint.calls) == 0  # No API call made
 
 
-def test_dynamic_find_value_triggers_attribute_collection(temp_workspace_dir, valid_workspace_id):
+def test_dynamic_find_value_triggers_attribute_collection(tmp_path, valid_workspace_id):
     """When find_value contains dynamic variables, _refresh_deployed_items collects extra attributes."""
     # Create a parameter file with dynamic variable in find_value
-    param_file = temp_workspace_dir / "parameter.yml"
+    param_file = tmp_path / "parameter.yml"
     param_file.write_text(
         """
 find_replace:
@@ -1598,7 +1434,7 @@ find_replace:
     )
 
     # Create a minimal item so workspace init succeeds
-    item_dir = temp_workspace_dir / "MyNotebook.Notebook"
+    item_dir = tmp_path / "MyNotebook.Notebook"
     item_dir.mkdir()
     platform = item_dir / ".platform"
     platform.write_text(
@@ -1609,7 +1445,7 @@ find_replace:
         encoding="utf-8",
     )
 
-    mock_ep = MagicMock()
+    mock_ep = MagicMock(spec=FabricEndpoint)
 
     items_response = {
         "body": {
@@ -1646,7 +1482,7 @@ find_replace:
     ):
         workspace = FabricWorkspace(
             workspace_id=valid_workspace_id,
-            repository_directory=str(temp_workspace_dir),
+            repository_directory=str(tmp_path),
             item_type_in_scope=["Notebook"],
             environment="PPE",
             token_credential=DummyTokenCredential(),
@@ -1666,11 +1502,11 @@ find_replace:
         assert workspace.workspace_items["Lakehouse"]["TestLH"]["sqlendpointid"] == "sqlep-id"
 
 
-def test_refresh_deployed_items_tolerates_missing_sqlendpoint(temp_workspace_dir, valid_workspace_id, caplog):
+def test_refresh_deployed_items_tolerates_missing_sqlendpoint(tmp_path, valid_workspace_id, caplog):
     """A newly provisioned lakehouse (e.g. Dataflow Gen2 staging lakehouse)
     with an unpopulated SQL endpoint must not fail the deployed-items refresh."""
 
-    param_file = temp_workspace_dir / "parameter.yml"
+    param_file = tmp_path / "parameter.yml"
     param_file.write_text(
         """
 find_replace:
@@ -1681,7 +1517,7 @@ find_replace:
         encoding="utf-8",
     )
 
-    item_dir = temp_workspace_dir / "MyNotebook.Notebook"
+    item_dir = tmp_path / "MyNotebook.Notebook"
     item_dir.mkdir()
     platform = item_dir / ".platform"
     platform.write_text(
@@ -1692,7 +1528,7 @@ find_replace:
         encoding="utf-8",
     )
 
-    mock_ep = MagicMock()
+    mock_ep = MagicMock(spec=FabricEndpoint)
 
     items_response = {
         "body": {
@@ -1728,7 +1564,7 @@ find_replace:
     ):
         workspace = FabricWorkspace(
             workspace_id=valid_workspace_id,
-            repository_directory=str(temp_workspace_dir),
+            repository_directory=str(tmp_path),
             item_type_in_scope=["Notebook"],
             environment="PPE",
             token_credential=DummyTokenCredential(),
@@ -1746,10 +1582,10 @@ find_replace:
         assert "Attribute value not found" in caplog.text
 
 
-def test_static_params_skip_attribute_collection(temp_workspace_dir, valid_workspace_id):
+def test_static_params_skip_attribute_collection(tmp_path, valid_workspace_id):
     """When only static parameters are present, _refresh_deployed_items skips extra attribute calls."""
     # Create a parameter file with only static values
-    param_file = temp_workspace_dir / "parameter.yml"
+    param_file = tmp_path / "parameter.yml"
     param_file.write_text(
         """
 find_replace:
@@ -1760,7 +1596,7 @@ find_replace:
         encoding="utf-8",
     )
 
-    item_dir = temp_workspace_dir / "MyNotebook.Notebook"
+    item_dir = tmp_path / "MyNotebook.Notebook"
     item_dir.mkdir()
     platform = item_dir / ".platform"
     platform.write_text(
@@ -1771,7 +1607,7 @@ find_replace:
         encoding="utf-8",
     )
 
-    mock_ep = MagicMock()
+    mock_ep = MagicMock(spec=FabricEndpoint)
 
     items_response = {
         "body": {
@@ -1803,7 +1639,7 @@ find_replace:
     ):
         workspace = FabricWorkspace(
             workspace_id=valid_workspace_id,
-            repository_directory=str(temp_workspace_dir),
+            repository_directory=str(tmp_path),
             item_type_in_scope=["Notebook"],
             environment="PPE",
             token_credential=DummyTokenCredential(),
@@ -1823,72 +1659,66 @@ find_replace:
         assert workspace.workspace_items["Lakehouse"]["TestLH"]["sqlendpointid"] == ""
 
 
-def test_get_item_attribute_unsupported_and_empty(patched_fabric_workspace, valid_workspace_id, temp_workspace_dir):
+def test_get_item_attribute_unsupported_and_empty(
+    patched_fabric_workspace, valid_workspace_id, empty_workspace_dir, mock_fabric_endpoint
+):
     """Test edge cases: unsupported attribute and empty attribute value."""
-    mock_endpoint = MagicMock()
-    mock_endpoint.invoke.return_value = {"body": {}}
+    mock_fabric_endpoint.response = {"body": {}}
 
-    with patch("fabric_cicd.fabric_workspace.FabricEndpoint", return_value=mock_endpoint):
-        workspace = patched_fabric_workspace(
-            workspace_id=valid_workspace_id,
-            repository_directory=str(temp_workspace_dir),
-        )
-        workspace.endpoint = mock_endpoint
+    workspace = patched_fabric_workspace(
+        workspace_id=valid_workspace_id,
+        repository_directory=str(empty_workspace_dir),
+    )
+    workspace.endpoint = mock_fabric_endpoint
 
-        # Test unsupported attribute for supported item type - should return empty string without API call
-        result = workspace._get_item_attribute("ws1", "Lakehouse", "guid1", "name1", "unsupportedattr")
-        assert result == ""
-        assert mock_endpoint.invoke.call_count == 0  # No API call made
+    # Test unsupported attribute for supported item type - should return empty string without API call
+    result = workspace._get_item_attribute("ws1", "Lakehouse", "guid1", "name1", "unsupportedattr")
+    assert result == ""
+    assert len(mock_fabric_endpoint.calls) == 0  # No API call made
 
-        # Test valid call that results in empty attribute value - should raise InputError
-        mock_endpoint.invoke.return_value = {
-            "body": {
-                "properties": {
-                    "sqlEndpointProperties": {
-                        "connectionString": ""  # Empty value
-                    }
+    # Test valid call that results in empty attribute value - should raise InputError
+    mock_fabric_endpoint.response = {
+        "body": {
+            "properties": {
+                "sqlEndpointProperties": {
+                    "connectionString": ""  # Empty value
                 }
             }
         }
+    }
 
-        from fabric_cicd._common._exceptions import InputError
-
-        with pytest.raises(InputError) as exc_info:
-            workspace._get_item_attribute("ws1", "Lakehouse", "guid1", "name1", "sqlendpoint")
+    from fabric_cicd._common._exceptions import InputError
 
-        assert "Attribute value not found" in str(exc_info.value)
-        assert "Lakehouse" in str(exc_info.value)
-        assert "name1" in str(exc_info.value)
+    with pytest.raises(InputError, match="Attribute value not found for Lakehouse 'name1'"):
+        workspace._get_item_attribute("ws1", "Lakehouse", "guid1", "name1", "sqlendpoint")
 
-        # Verify the error case was not cached
-        with pytest.raises(InputError):
-            workspace._get_item_attribute("ws1", "Lakehouse", "guid1", "name1", "sqlendpoint")
-        # Should still be only 1 API call per lookup (cached error not stored)
-        assert mock_endpoint.invoke.call_count == 2
+    # Verify the error case was not cached
+    with pytest.raises(InputError):
+        workspace._get_item_attribute("ws1", "Lakehouse", "guid1", "name1", "sqlendpoint")
+    # Should still be only 1 API call per lookup (cached error not stored)
+    assert len(mock_fabric_endpoint.calls) == 2
 
 
 def test_get_item_attribute_not_required_returns_empty(
-    patched_fabric_workspace, valid_workspace_id, temp_workspace_dir, caplog
+    patched_fabric_workspace, valid_workspace_id, empty_workspace_dir, mock_fabric_endpoint, caplog
 ):
     """When required=False, an unresolved attribute returns '' with a warning instead of raising."""
-    mock_endpoint = MagicMock()
-    mock_endpoint.invoke.return_value = {"body": {"properties": {"sqlEndpointProperties": {"connectionString": ""}}}}
+    mock_fabric_endpoint.response = {"body": {"properties": {"sqlEndpointProperties": {"connectionString": ""}}}}
 
-    with patch("fabric_cicd.fabric_workspace.FabricEndpoint", return_value=mock_endpoint):
-        workspace = patched_fabric_workspace(
-            workspace_id=valid_workspace_id,
-            repository_directory=str(temp_workspace_dir),
-        )
-        workspace.endpoint = mock_endpoint
+    workspace = patched_fabric_workspace(
+        workspace_id=valid_workspace_id,
+        repository_directory=str(empty_workspace_dir),
+    )
+    workspace.endpoint = mock_fabric_endpoint
 
-        with caplog.at_level("WARNING"):
-            result = workspace._get_item_attribute(
-                "ws1", "Lakehouse", "StagingLakehouseForDataflows_1", "name1", "sqlendpoint", required=False
-            )
+    with caplog.at_level("WARNING"):
+        result = workspace._get_item_attribute(
+            "ws1", "Lakehouse", "StagingLakehouseForDataflows_1", "name1", "sqlendpoint", required=False
+        )
 
-        assert result == ""
-        assert mock_endpoint.invoke.call_count == 1
-        assert "Attribute value not found" in caplog.text
+    assert result == ""
+    assert len(mock_fabric_endpoint.calls) == 1
+    assert "Attribute value not found" in caplog.text
 
 
 def test_multiple_items_with_default_guid_logical_id(temp_workspace_dir, patched_fabric_workspace, valid_workspace_id):
@@ -1897,24 +1727,8 @@ def test_multiple_items_with_default_guid_logical_id(temp_workspace_dir, patched
     default_guid = constants.DEFAULT_GUID
 
     for i, item_dir_name in enumerate(["Notebook1.Notebook", "Notebook2.Notebook", "Pipeline1.DataPipeline"]):
-        item_dir = temp_workspace_dir / item_dir_name
-        item_dir.mkdir(parents=True, exist_ok=True)
-
         item_type = "Notebook" if "Notebook" in item_dir_name else "DataPipeline"
-        metadata_content = {
-            "metadata": {
-                "type": item_type,
-                "displayName": f"Item {i}",
-                "description": "",
-            },
-            "config": {"logicalId": default_guid},
-        }
-
-        with (item_dir / ".platform").open("w", encoding="utf-8") as f:
-            json.dump(metadata_content, f, ensure_ascii=False)
-
-        with (item_dir / "dummy.txt").open("w", encoding="utf-8") as f:
-            f.write("Dummy file content")
+        create_platform_file(temp_workspace_dir / item_dir_name, item_type, f"Item {i}", default_guid)
 
     # Should NOT raise any error
     workspace = patched_fabric_workspace(
@@ -1939,23 +1753,9 @@ def test_duplicate_non_default_logical_id_raises_error(
     duplicate_logical_id = "aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee"
 
     for i, item_dir_name in enumerate(["Notebook1.Notebook", "Notebook2.Notebook"]):
-        item_dir = temp_workspace_dir / item_dir_name
-        item_dir.mkdir(parents=True, exist_ok=True)
-
-        metadata_content = {
-            "metadata": {
-                "type": "Notebook",
-                "displayName": f"Duplicate Item {i}",
-                "description": "",
-            },
-            "config": {"logicalId": duplicate_logical_id},
-        }
-
-        with (item_dir / ".platform").open("w", encoding="utf-8") as f:
-            json.dump(metadata_content, f, ensure_ascii=False)
-
-        with (item_dir / "dummy.txt").open("w", encoding="utf-8") as f:
-            f.write("Dummy file content")
+        create_platform_file(
+            temp_workspace_dir / item_dir_name, "Notebook", f"Duplicate Item {i}", duplicate_logical_id
+        )
 
     with pytest.raises(FailedPublishedItemStatusError) as exc_info:
         patched_fabric_workspace(
@@ -1964,20 +1764,21 @@ def test_duplicate_non_default_logical_id_raises_error(
             item_type_in_scope=["Notebook"],
         )
 
-    assert "Duplicate logicalId" in str(exc_info.value)
-    assert duplicate_logical_id in str(exc_info.value)
+    error_message = str(exc_info.value)
+    assert "Duplicate logicalId" in error_message
+    assert duplicate_logical_id in error_message
 
 
-def test_replace_logical_ids_skips_default_guid(temp_workspace_dir, patched_fabric_workspace, valid_workspace_id):
+@pytest.mark.usefixtures("skip_repository_items_refresh")
+def test_replace_logical_ids_skips_default_guid(empty_workspace_dir, patched_fabric_workspace, valid_workspace_id):
     """Test that _replace_logical_ids skips items with DEFAULT_GUID as their logical ID."""
     from fabric_cicd._common._item import Item
 
-    with patch.object(FabricWorkspace, "_refresh_repository_items"):
-        workspace = patched_fabric_workspace(
-            workspace_id=valid_workspace_id,
-            repository_directory=str(temp_workspace_dir),
-            item_type_in_scope=["Notebook"],
-        )
+    workspace = patched_fabric_workspace(
+        workspace_id=valid_workspace_id,
+        repository_directory=str(empty_workspace_dir),
+        item_type_in_scope=["Notebook"],
+    )
 
     # Set up repository items with DEFAULT_GUID logical IDs
     workspace.repository_items = {
@@ -2010,18 +1811,18 @@ def test_replace_logical_ids_skips_default_guid(temp_workspace_dir, patched_fabr
     assert "actual-guid-2222" not in result
 
 
+@pytest.mark.usefixtures("skip_repository_items_refresh")
 def test_replace_logical_ids_replaces_non_default_guid(
-    temp_workspace_dir, patched_fabric_workspace, valid_workspace_id
+    empty_workspace_dir, patched_fabric_workspace, valid_workspace_id
 ):
     """Test that _replace_logical_ids still replaces non-default logical IDs correctly."""
     from fabric_cicd._common._item import Item
 
-    with patch.object(FabricWorkspace, "_refresh_repository_items"):
-        workspace = patched_fabric_workspace(
-            workspace_id=valid_workspace_id,
-            repository_directory=str(temp_workspace_dir),
-            item_type_in_scope=["Notebook"],
-        )
+    workspace = patched_fabric_workspace(
+        workspace_id=valid_workspace_id,
+        repository_directory=str(empty_workspace_dir),
+        item_type_in_scope=["Notebook"],
+    )
 
     logical_id = "aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee"
     item_guid = "11111111-2222-3333-4444-555555555555"
@@ -2050,40 +1851,20 @@ def test_mix_of_default_and_non_default_logical_ids(temp_workspace_dir, patched_
     unique_logical_id = "aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee"
 
     # Item 1: export API item with default GUID
-    item_dir_1 = temp_workspace_dir / "ExportedNotebook.Notebook"
-    item_dir_1.mkdir(parents=True, exist_ok=True)
-    metadata_1 = {
-        "metadata": {"type": "Notebook", "displayName": "Exported Notebook", "description": ""},
-        "config": {"logicalId": constants.DEFAULT_GUID},
-    }
-    with (item_dir_1 / ".platform").open("w", encoding="utf-8") as f:
-        json.dump(metadata_1, f)
-    with (item_dir_1 / "dummy.txt").open("w", encoding="utf-8") as f:
-        f.write("content")
+    create_platform_file(
+        temp_workspace_dir / "ExportedNotebook.Notebook", "Notebook", "Exported Notebook", constants.DEFAULT_GUID
+    )
 
     # Item 2: git integration item with unique logical ID
-    item_dir_2 = temp_workspace_dir / "GitNotebook.Notebook"
-    item_dir_2.mkdir(parents=True, exist_ok=True)
-    metadata_2 = {
-        "metadata": {"type": "Notebook", "displayName": "Git Notebook", "description": ""},
-        "config": {"logicalId": unique_logical_id},
-    }
-    with (item_dir_2 / ".platform").open("w", encoding="utf-8") as f:
-        json.dump(metadata_2, f)
-    with (item_dir_2 / "dummy.txt").open("w", encoding="utf-8") as f:
-        f.write("content")
+    create_platform_file(temp_workspace_dir / "GitNotebook.Notebook", "Notebook", "Git Notebook", unique_logical_id)
 
     # Item 3: another export API item with default GUID
-    item_dir_3 = temp_workspace_dir / "ExportedPipeline.DataPipeline"
-    item_dir_3.mkdir(parents=True, exist_ok=True)
-    metadata_3 = {
-        "metadata": {"type": "DataPipeline", "displayName": "Exported Pipeline", "description": ""},
-        "config": {"logicalId": constants.DEFAULT_GUID},
-    }
-    with (item_dir_3 / ".platform").open("w", encoding="utf-8") as f:
-        json.dump(metadata_3, f)
-    with (item_dir_3 / "dummy.txt").open("w", encoding="utf-8") as f:
-        f.write("content")
+    create_platform_file(
+        temp_workspace_dir / "ExportedPipeline.DataPipeline",
+        "DataPipeline",
+        "Exported Pipeline",
+        constants.DEFAULT_GUID,
+    )
 
     # Should NOT raise any error
     workspace = patched_fabric_workspace(
@@ -2180,8 +1961,9 @@ def test_publish_non_variable_library_calls_all_replacements(
         mock_ws.assert_called_once()
 
 
+@pytest.mark.usefixtures("skip_repository_items_refresh")
 def test_api_root_url_snapshot_is_not_retargeted_by_second_configure_call(
-    temp_workspace_dir, patched_fabric_workspace, monkeypatch
+    empty_workspace_dir, patched_fabric_workspace, monkeypatch
 ):
     """Test that a constructed FabricWorkspace retains its snapshotted URL
     even if configure_fabric_fqdn is called again for a different workspace."""
@@ -2196,11 +1978,10 @@ def test_api_root_url_snapshot_is_not_retargeted_by_second_configure_call(
     configure_fabric_fqdn(workspace_id_a)
     expected_fqdn_a = constants.DEFAULT_API_ROOT_URL  # snapshot what was set
 
-    with patch.object(FabricWorkspace, "_refresh_repository_items"):
-        workspace_a = patched_fabric_workspace(
-            workspace_id=workspace_id_a,
-            repository_directory=str(temp_workspace_dir),
-        )
+    workspace_a = patched_fabric_workspace(
+        workspace_id=workspace_id_a,
+        repository_directory=str(empty_workspace_dir),
+    )
 
     # Now configure for workspace b
     configure_fabric_fqdn(workspace_id_b)
@@ -3,146 +3,107 @@
 
 """Integration test for publish operations using mock Fabric API server."""
 
-import gzip
-import importlib
-import os
-import shutil
 from pathlib import Path
-from urllib.parse import urlparse
 
 import pytest
 from fixtures.credentials import DummyTokenCredential
-from fixtures.mock_fabric_server import MOCK_SERVER_PORT, MockFabricServer
+from fixtures.mock_fabric_server import MockFabricServer
 
 import fabric_cicd
-import fabric_cicd._common._validate_env_vars as validate_env_vars
 import fabric_cicd.constants
 
-
-@pytest.fixture
-def allow_localhost_http_for_integration(monkeypatch: pytest.MonkeyPatch):
-    """
-    Test-only override: allow http://localhost for mocked integration servers.
-    """
-    real_validate = validate_env_vars.validate_env_var_api_url
-
-    def _validate_api_url_test(env_var_name: str, default_value: str) -> str:
-        value = os.environ.get(env_var_name, default_value)
-        parsed = urlparse(value)
-        host = (parsed.hostname or "").lower()
-
-        if parsed.scheme == "http" and host in {"localhost", "127.0.0.1", "::1"}:
-            return value.rstrip("/")
-
-        return real_validate(env_var_name, default_value)
-
-    monkeypatch.setattr(validate_env_vars, "validate_env_var_api_url", _validate_api_url_test)
-    return
+_ITEM_TYPES_TO_DEPLOY = (
+    "Dataflow",
+    "DataPipeline",
+    "Environment",
+    "Eventhouse",
+    "Eventstream",
+    "KQLDatabase",
+    "KQLQueryset",
+    "Lakehouse",
+    "Map",
+    "MirroredDatabase",
+    "MLExperiment",
+    "Notebook",
+    "Ontology",
+    "PaginatedReport",
+    "Reflex",
+    "Report",
+    "SemanticModel",
+    "SparkJobDefinition",
+    "SQLDatabase",
+    "VariableLibrary",
+    "Warehouse",
+)
 
 
 @pytest.fixture
-def mock_fabric_api_server(allow_localhost_http_for_integration):  # noqa: ARG001
+def mock_fabric_api_server(monkeypatch: pytest.MonkeyPatch):
     """
     Start mock Fabric API server for the test.
 
-    Yields the server and sets environment variables for API URLs.
+    Yields the server and points the API root URL constants at it.
     """
     tests_dir = Path(__file__).parent
     trace_file_gz = tests_dir / "fixtures" / MockFabricServer.HTTP_TRACE_FILE
-    trace_file = trace_file_gz.with_suffix("")
 
     if not trace_file_gz.exists():
         pytest.skip(
             "http_trace.json.gz not found - run devtools/debug_trace_deployment.py first to generate trace data"
         )
 
-    if trace_file.exists():
-        trace_file.unlink()
-    with gzip.open(trace_file_gz, "rb") as f_in, trace_file.open("wb") as f_out:
-        shutil.copyfileobj(f_in, f_out)
-
-    server = MockFabricServer(trace_file, port=MOCK_SERVER_PORT)
-
-    original_default_api = os.environ.get("DEFAULT_API_ROOT_URL")
-    original_fabric_api = os.environ.get("FABRIC_API_ROOT_URL")
-    original_retry_delay = os.environ.get("FABRIC_CICD_RETRY_DELAY_OVERRIDE_SECONDS")
-
-    os.environ["DEFAULT_API_ROOT_URL"] = f"http://127.0.0.1:{MOCK_SERVER_PORT}"
-    os.environ["FABRIC_API_ROOT_URL"] = f"http://127.0.0.1:{MOCK_SERVER_PORT}"
-    os.environ["FABRIC_CICD_RETRY_DELAY_OVERRIDE_SECONDS"] = "0"
-
-    # reload only after env is set and override fixture is active
-    importlib.reload(fabric_cicd.constants)
-
+    # Port 0 lets the OS pick a free port, so concurrent test processes never collide
+    server = MockFabricServer(trace_file_gz, port=0)
     server.start()
 
+    # Patch the URL constants resolved at import time rather than reloading fabric_cicd.constants,
+    # which would also recreate enums and sets already imported by other modules
+    mock_api_url = f"http://127.0.0.1:{server.port}"
+    monkeypatch.setattr(fabric_cicd.constants, "DEFAULT_API_ROOT_URL", mock_api_url)
+    monkeypatch.setattr(fabric_cicd.constants, "FABRIC_API_ROOT_URL", mock_api_url)
+    monkeypatch.setattr(fabric_cicd.constants, "FEATURE_FLAG", set(fabric_cicd.constants.FEATURE_FLAG))
+    monkeypatch.setenv("FABRIC_CICD_RETRY_DELAY_OVERRIDE_SECONDS", "0")
+
     yield server
 
     server.stop()
 
-    if original_default_api is not None:
-        os.environ["DEFAULT_API_ROOT_URL"] = original_default_api
-    else:
-        os.environ.pop("DEFAULT_API_ROOT_URL", None)
-
-    if original_fabric_api is not None:
-        os.environ["FABRIC_API_ROOT_URL"] = original_fabric_api
-    else:
-        os.environ.pop("FABRIC_API_ROOT_URL", None)
-
-    if original_retry_delay is not None:
-        os.environ["FABRIC_CICD_RETRY_DELAY_OVERRIDE_SECONDS"] = original_retry_delay
-    else:
-        os.environ.pop("FABRIC_CICD_RETRY_DELAY_OVERRIDE_SECONDS", None)
-
-    importlib.reload(fabric_cicd.constants)
-
-
-def test_publish_all_items_integration(mock_fabric_api_server):  # noqa: ARG001
-    """Test full publish_all_items workflow using mocked API responses."""
-    workspace_id = "00000000-0000-0000-0000-000000000000"
-    environment_key = "PPE"
 
+def _publish_sample_workspace(item_type_in_scope: list[str]) -> fabric_cicd.FabricWorkspace:
+    """Publish the sample workspace items of the given types against the mock server."""
     root_directory = Path(__file__).resolve().parent.parent
     artifacts_folder = root_directory / "sample" / "workspace"
 
-    item_types_to_deploy = [
-        "Dataflow",
-        "DataPipeline",
-        "Environment",
-        "Eventhouse",
-        "Eventstream",
-        "KQLDatabase",
-        "KQLQueryset",
-        "Lakehouse",
-        "Map",
-        "MirroredDatabase",
-        "MLExperiment",
-        "Notebook",
-        "Ontology",
-        "PaginatedReport",
-        "Reflex",
-        "Report",
-        "SemanticModel",
-        "SparkJobDefinition",
-        "SQLDatabase",
-        "VariableLibrary",
-        "Warehouse",
-    ]
-
-    token_credential = DummyTokenCredential()
-
     for flag in ["enable_shortcut_publish", "continue_on_shortcut_failure"]:
         fabric_cicd.append_feature_flag(flag)
 
     target_workspace = fabric_cicd.FabricWorkspace(
-        workspace_id=workspace_id,
-        environment=environment_key,
+        workspace_id="00000000-0000-0000-0000-000000000000",
+        environment="PPE",
         repository_directory=str(artifacts_folder),
-        item_type_in_scope=item_types_to_deploy,
-        token_credential=token_credential,
+        item_type_in_scope=item_type_in_scope,
+        token_credential=DummyTokenCredential(),
     )
 
     fabric_cicd.publish_all_items(target_workspace)
 
-    assert True, "Publish completed successfully"
+    return target_workspace
+
+
+def test_publish_all_items_integration(mock_fabric_api_server):  # noqa: ARG001
+    """Test full publish_all_items workflow using mocked API responses."""
+    # item_type_in_scope is validated as a list
+    target_workspace = _publish_sample_workspace(list(_ITEM_TYPES_TO_DEPLOY))
+
+    for item_type in _ITEM_TYPES_TO_DEPLOY:
+        assert all(item.guid for item in target_workspace.repository_items[item_type].values()), item_type
+
+
+@pytest.mark.parametrize("item_type", _ITEM_TYPES_TO_DEPLOY)
+def test_publish_single_item_type_integration(mock_fabric_api_server, item_type):  # noqa: ARG001
+    """Test publish_all_items scoped to a single item type using mocked API responses."""
+    target_workspace = _publish_sample_workspace([item_type])
+
+    published_items = target_workspace.repository_items[item_type]
+    assert published_items, f"No {item_type} items found in the sample workspace"
+    assert all(item.guid for item in published_items.values()), f"{item_type} items published without a guid"
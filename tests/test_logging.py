@@ -4,10 +4,9 @@
 """Tests for the logging module and wrapper functions."""
 
 import logging
-import shutil
-import tempfile
+import os
+from collections import deque
 from logging.handlers import RotatingFileHandler
-from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -21,6 +20,7 @@ from fabric_cicd import (
     get_supported_feature_flags,
     remove_feature_flag,
 )
+from fabric_cicd._common._exceptions import InputError
 from fabric_cicd._common._logging import (
     CustomFormatter,
     PackageFilter,
@@ -38,30 +38,49 @@ from fabric_cicd._common._logging import (
     get_file_handler,
     log_header,
 )
+from fabric_cicd._common._validate_env_vars import is_env_flag_enabled
+
+# Logger instances are process-wide singletons, so look them up once
+ROOT_LOGGER = logging.getLogger()
+PACKAGE_LOGGER = logging.getLogger("fabric_cicd")
+CONSOLE_ONLY_LOGGER = logging.getLogger("console_only")
+
+
+def _make_record(level: int, msg: str = "test", name: str = "fabric_cicd") -> logging.LogRecord:
+    """Build a LogRecord with no source location, args or exception info."""
+    return logging.LogRecord(name=name, level=level, pathname="", lineno=0, msg=msg, args=(), exc_info=None)
+
+
+def _file_handlers(logger: logging.Logger) -> list[logging.FileHandler]:
+    """Return the file handlers attached to a logger."""
+    return [h for h in logger.handlers if isinstance(h, logging.FileHandler)]
 
 
 def _close_all_file_handlers():
     """Close all file handlers to release file locks on Windows."""
-    for logger_name in ("", "fabric_cicd"):
-        logger = logging.getLogger(logger_name)
-        for handler in logger.handlers[:]:
-            if isinstance(handler, (logging.FileHandler, RotatingFileHandler)):
-                handler.close()
-                logger.removeHandler(handler)
+    for logger in (ROOT_LOGGER, PACKAGE_LOGGER):
+        for handler in _file_handlers(logger):
+            handler.close()
+            logger.removeHandler(handler)
+
 
+class _CaptureHandler(logging.Handler):
+    """Handler that keeps the last few formatted messages in memory."""
 
-def _reset_logger(logger_name: str) -> None:
-    """Reset a logger to clean state."""
-    logger = logging.getLogger(logger_name)
-    logger.handlers = []
+    def __init__(self, maxlen: int = 8) -> None:
+        super().__init__()
+        self.messages = deque(maxlen=maxlen)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
 
 
 @pytest.fixture(autouse=True)
 def _clean_logging_state():
     """Reset logging state before and after each test to release file locks on Windows."""
     _close_all_file_handlers()
-    for logger_name in ("", "fabric_cicd", "console_only"):
-        _reset_logger(logger_name)
+    for logger in (ROOT_LOGGER, PACKAGE_LOGGER, CONSOLE_ONLY_LOGGER):
+        logger.handlers = []
 
     yield
 
@@ -69,12 +88,10 @@ def _clean_logging_state():
 
 
 @pytest.fixture
-def temp_log_dir():
-    """Create a temporary directory for log files."""
-    tmpdir = Path(tempfile.mkdtemp())
-    yield tmpdir
+def temp_log_dir(tmp_path):
+    """Provide a per-test directory for log files, closing file handlers before pytest cleans it up."""
+    yield tmp_path
     _close_all_file_handlers()
-    shutil.rmtree(tmpdir, ignore_errors=True)
 
 
 @pytest.fixture
@@ -104,6 +121,12 @@ def external_logger_with_handler(temp_log_dir):
     logger.removeHandler(handler)
 
 
+@pytest.fixture(scope="module")
+def custom_formatter():
+    """Provide the console CustomFormatter shared by the formatter tests; format() keeps no state."""
+    return CustomFormatter("[%(levelname)s] %(asctime)s - %(message)s", datefmt="%H:%M:%S")
+
+
 class TestCustomFormatter:
     """Tests for the CustomFormatter class."""
 
@@ -117,36 +140,41 @@ class TestCustomFormatter:
             (logging.CRITICAL, "crit", "Critical message"),
         ],
     )
-    def test_format_levels(self, level, level_name, message):
+    def test_format_levels(self, custom_formatter, level, level_name, message):
         """Test formatting of various log levels."""
-        formatter = CustomFormatter("[%(levelname)s] %(asctime)s - %(message)s", datefmt="%H:%M:%S")
-        record = logging.LogRecord(
-            name="fabric_cicd",
-            level=level,
-            pathname="",
-            lineno=0,
-            msg=message,
-            args=(),
-            exc_info=None,
-        )
-        formatted = formatter.format(record)
+        record = _make_record(level, message)
+        formatted = custom_formatter.format(record)
         assert level_name in formatted.lower()
         assert message in formatted
 
-    def test_format_with_indent(self):
-        """Test formatting of messages with indent marker."""
+    def test_format_unknown_level(self, custom_formatter):
+        """Test that levels without a tag are formatted with the padded unknown prefix."""
+        record = _make_record(logging.CRITICAL + 5, "Custom level message")
+        formatted = custom_formatter.format(record)
+        assert formatted.startswith("[unknown] ")
+        assert "Custom level message" in formatted
 
+    def test_format_time_reuses_timestamp_within_a_second(self):
+        """Test formatTime matches the stdlib output and reuses it for records in the same second."""
         formatter = CustomFormatter("[%(levelname)s] %(asctime)s - %(message)s", datefmt="%H:%M:%S")
-        record = logging.LogRecord(
-            name="fabric_cicd",
-            level=logging.INFO,
-            pathname="",
-            lineno=0,
-            msg=f"{constants.INDENT}Indented message",
-            args=(),
-            exc_info=None,
+        stdlib_formatter = logging.Formatter(datefmt="%H:%M:%S")
+        first, same_second, next_second = (_make_record(logging.INFO) for _ in range(3))
+        first.created, same_second.created, next_second.created = 1_700_000_000.1, 1_700_000_000.9, 1_700_000_001.2
+
+        first_time = formatter.formatTime(first, formatter.datefmt)
+        with patch("logging.Formatter.formatTime") as stdlib_format_time:
+            assert formatter.formatTime(same_second, formatter.datefmt) == first_time
+            stdlib_format_time.assert_not_called()
+
+        assert first_time == stdlib_formatter.formatTime(first, "%H:%M:%S")
+        assert formatter.formatTime(next_second, formatter.datefmt) == stdlib_formatter.formatTime(
+            next_second, "%H:%M:%S"
         )
-        formatted = formatter.format(record)
+
+    def test_format_with_indent(self, custom_formatter):
+        """Test formatting of messages with indent marker."""
+        record = _make_record(logging.INFO, f"{constants.INDENT}Indented message")
+        formatted = custom_formatter.format(record)
         assert "Indented message" in formatted
         assert formatted.startswith(" " * 8)
 
@@ -168,9 +196,7 @@ class TestPackageFilter:
     def test_namespace_filtering(self, logger_name, expected):
         """Test filter correctly handles fabric_cicd and third-party namespaces."""
         filter_instance = PackageFilter()
-        record = logging.LogRecord(
-            name=logger_name, level=logging.INFO, pathname="", lineno=0, msg="test", args=(), exc_info=None
-        )
+        record = _make_record(logging.INFO, name=logger_name)
         assert filter_instance.filter(record) is expected
 
     @pytest.mark.parametrize(
@@ -186,17 +212,13 @@ class TestPackageFilter:
     def test_debug_only_mode(self, level, expected):
         """Test debug_only=True only allows DEBUG level from fabric_cicd."""
         filter_instance = PackageFilter(debug_only=True)
-        record = logging.LogRecord(
-            name="fabric_cicd", level=level, pathname="", lineno=0, msg="test", args=(), exc_info=None
-        )
+        record = _make_record(level)
         assert filter_instance.filter(record) is expected
 
     def test_debug_only_still_checks_namespace(self):
         """Test debug_only=True still blocks non-fabric_cicd DEBUG logs."""
         filter_instance = PackageFilter(debug_only=True)
-        record = logging.LogRecord(
-            name="azure.identity", level=logging.DEBUG, pathname="", lineno=0, msg="debug", args=(), exc_info=None
-        )
+        record = _make_record(logging.DEBUG, "debug", name="azure.identity")
         assert filter_instance.filter(record) is False
 
     def test_default_allows_all_levels_from_package(self):
@@ -204,9 +226,7 @@ class TestPackageFilter:
         filter_instance = PackageFilter(debug_only=False)
         levels = [logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR, logging.CRITICAL]
         for level in levels:
-            record = logging.LogRecord(
-                name="fabric_cicd", level=level, pathname="", lineno=0, msg="test", args=(), exc_info=None
-            )
+            record = _make_record(level)
             assert filter_instance.filter(record) is True
 
 
@@ -273,15 +293,14 @@ class TestCleanupManagedHandlers:
             _mark_external_handler(external_handler)
             external_handler.addFilter(PackageFilter(debug_only=True))
 
-            root_logger = logging.getLogger()
-            root_logger.addHandler(external_handler)
+            ROOT_LOGGER.addHandler(external_handler)
 
             assert len(external_handler.filters) == 1
             assert isinstance(external_handler.filters[0], PackageFilter)
 
-            _cleanup_managed_handlers(root_logger)
+            _cleanup_managed_handlers(ROOT_LOGGER)
 
-            assert external_handler not in root_logger.handlers
+            assert external_handler not in ROOT_LOGGER.handlers
             assert len(external_handler.filters) == 0
             assert getattr(external_handler, "_fabric_cicd_external", False) is False
 
@@ -316,17 +335,7 @@ class TestConfigureDefaultFileHandler:
         handler = _RestrictedFileHandler(str(log_file), mode="w", delay=True)
         try:
             with patch("fabric_cicd._common._secure_io.restrict_file") as mock_restrict:
-                handler.emit(
-                    logging.LogRecord(
-                        name="fabric_cicd",
-                        level=logging.ERROR,
-                        pathname="",
-                        lineno=0,
-                        msg="test",
-                        args=(),
-                        exc_info=None,
-                    )
-                )
+                handler.emit(_make_record(logging.ERROR))
                 mock_restrict.assert_called_once_with(handler.baseFilename)
         finally:
             handler.close()
@@ -368,9 +377,7 @@ class TestConfigureExternalFileHandler:
             handler = _configure_external_file_handler(external_handler, logging.DEBUG, debug_only_file=True)
 
             # Verify formatter is preserved by checking it formats correctly
-            record = logging.LogRecord(
-                name="fabric_cicd", level=logging.DEBUG, pathname="", lineno=0, msg="test", args=(), exc_info=None
-            )
+            record = _make_record(logging.DEBUG)
             formatted = handler.formatter.format(record)
             assert formatted.startswith("CUSTOM - DEBUG - test")
         finally:
@@ -425,40 +432,37 @@ class TestGetFileHandler:
 
     def test_returns_managed_file_handler_from_root(self):
         """Test returns the managed file handler from root logger."""
-        root_logger = logging.getLogger()
         handler = _mark_handler(logging.FileHandler("test_get.log", delay=True))
-        root_logger.addHandler(handler)
+        ROOT_LOGGER.addHandler(handler)
 
         try:
             result = get_file_handler()
             assert result is handler
         finally:
             handler.close()
-            root_logger.removeHandler(handler)
+            ROOT_LOGGER.removeHandler(handler)
 
     def test_ignores_unmanaged_file_handler_on_root(self):
         """Test ignores file handlers not marked as managed on root logger."""
-        root_logger = logging.getLogger()
         handler = logging.FileHandler("test_unmanaged.log", delay=True)
-        root_logger.addHandler(handler)
+        ROOT_LOGGER.addHandler(handler)
 
         try:
             assert get_file_handler() is None
         finally:
             handler.close()
-            root_logger.removeHandler(handler)
+            ROOT_LOGGER.removeHandler(handler)
 
     def test_ignores_external_file_handler_on_root(self):
         """Test ignores file handlers marked as external on root logger."""
-        root_logger = logging.getLogger()
         handler = _mark_external_handler(logging.FileHandler("test_external.log", delay=True))
-        root_logger.addHandler(handler)
+        ROOT_LOGGER.addHandler(handler)
 
         try:
             assert get_file_handler() is None
         finally:
             handler.close()
-            root_logger.removeHandler(handler)
+            ROOT_LOGGER.removeHandler(handler)
 
     def test_returns_any_file_handler_from_provided_logger(self):
         """Test returns any file handler from provided logger."""
@@ -537,6 +541,13 @@ class TestBuildFileMessage:
 class TestConfigureLogger:
     """Tests for the configure_logger function."""
 
+    @pytest.fixture(autouse=True)
+    def _disable_log_emission(self):
+        """Drop records emitted while these tests inspect handler state; none of them assert on log output."""
+        logging.disable(logging.CRITICAL)
+        yield
+        logging.disable(logging.NOTSET)
+
     @pytest.mark.parametrize(
         ("level", "expected_package_level", "expected_root_level"),
         [
@@ -548,21 +559,19 @@ class TestConfigureLogger:
         """Test logger level configuration."""
         configure_logger(level=level, disable_log_file=True)
 
-        assert logging.getLogger("fabric_cicd").level == expected_package_level
-        assert logging.getLogger().level == expected_root_level
+        assert PACKAGE_LOGGER.level == expected_package_level
+        assert ROOT_LOGGER.level == expected_root_level
 
     def test_default_includes_file_handler(self):
         """Test default configuration includes file handler."""
         configure_logger()
-        root_logger = logging.getLogger()
-        file_handlers = [h for h in root_logger.handlers if isinstance(h, logging.FileHandler)]
+        file_handlers = _file_handlers(ROOT_LOGGER)
         assert len(file_handlers) == 1
 
     def test_disable_file_logging(self):
         """Test file logging can be disabled."""
         configure_logger(disable_log_file=True)
-        root_logger = logging.getLogger()
-        file_handlers = [h for h in root_logger.handlers if isinstance(h, logging.FileHandler)]
+        file_handlers = _file_handlers(ROOT_LOGGER)
         assert len(file_handlers) == 0
 
     def test_with_external_file_handler(self, external_rotating_handler, temp_log_dir):
@@ -576,10 +585,9 @@ class TestConfigureLogger:
             debug_only_file=True,
         )
 
-        root_logger = logging.getLogger()
         external_handlers = [
             h
-            for h in root_logger.handlers
+            for h in ROOT_LOGGER.handlers
             if isinstance(h, logging.FileHandler) and getattr(h, "_fabric_cicd_external", False)
         ]
         assert len(external_handlers) == 1
@@ -591,8 +599,7 @@ class TestConfigureLogger:
         """Test suppressing DEBUG output to console."""
         configure_logger(level=logging.DEBUG, suppress_debug_console=True, disable_log_file=True)
 
-        package_logger = logging.getLogger("fabric_cicd")
-        console_handlers = [h for h in package_logger.handlers if isinstance(h, logging.StreamHandler)]
+        console_handlers = [h for h in PACKAGE_LOGGER.handlers if isinstance(h, logging.StreamHandler)]
         assert len(console_handlers) == 1
         assert console_handlers[0].level == logging.INFO
 
@@ -600,44 +607,58 @@ class TestConfigureLogger:
         """Test console_only logger is properly configured."""
         configure_logger(disable_log_file=True)
 
-        console_only_logger = logging.getLogger("console_only")
-        package_logger = logging.getLogger("fabric_cicd")
-
-        assert console_only_logger.propagate is False
-        assert len(console_only_logger.handlers) == 1
-        assert package_logger.handlers[0] is not console_only_logger.handlers[0]
+        assert CONSOLE_ONLY_LOGGER.propagate is False
+        assert len(CONSOLE_ONLY_LOGGER.handlers) == 1
+        assert PACKAGE_LOGGER.handlers[0] is not CONSOLE_ONLY_LOGGER.handlers[0]
 
     def test_preserves_unmanaged_handlers(self):
         """Test that unmanaged handlers survive reconfiguration."""
-        root_logger = logging.getLogger()
         external_handler = logging.StreamHandler()
-        root_logger.addHandler(external_handler)
+        ROOT_LOGGER.addHandler(external_handler)
 
         configure_logger(disable_log_file=True)
         configure_logger(disable_log_file=True)
 
-        assert external_handler in root_logger.handlers
-        root_logger.removeHandler(external_handler)
+        assert external_handler in ROOT_LOGGER.handlers
+        ROOT_LOGGER.removeHandler(external_handler)
 
     def test_package_logger_propagates(self):
         """Test that package logger propagates to root."""
         configure_logger(disable_log_file=True)
-        assert logging.getLogger("fabric_cicd").propagate is True
+        assert PACKAGE_LOGGER.propagate is True
 
 
 class TestLogHeader:
     """Tests for the log_header function."""
 
-    def test_logs_expected_messages(self, caplog):
+    def test_logs_expected_messages(self):
         """Test log_header logs the expected messages."""
         logger = logging.getLogger("fabric_cicd.test")
         logger.setLevel(logging.INFO)
+        handler = _CaptureHandler()
+        logger.addHandler(handler)
 
-        with caplog.at_level(logging.INFO, logger="fabric_cicd.test"):
+        try:
             log_header(logger, "Test Header")
+        finally:
+            logger.removeHandler(handler)
 
-        assert len(caplog.records) >= 3
-        assert any("Test Header" in record.message for record in caplog.records)
+        assert len(handler.messages) >= 3
+        assert any("Test Header" in message for message in handler.messages)
+
+    def test_skips_when_info_disabled(self):
+        """Test log_header emits nothing when the logger would discard INFO."""
+        logger = logging.getLogger("fabric_cicd.test")
+        logger.setLevel(logging.WARNING)
+        handler = _CaptureHandler()
+        logger.addHandler(handler)
+
+        try:
+            log_header(logger, "Test Header")
+        finally:
+            logger.removeHandler(handler)
+
+        assert not handler.messages
 
 
 class TestWrapperFunctions:
@@ -698,17 +719,11 @@ class TestWrapperFunctions:
             assert flag in constants.FEATURE_FLAG
 
     @pytest.mark.parametrize("level_input", ["DEBUG", "debug"])
-    def test_change_log_level(self, level_input, temp_log_dir):
+    def test_change_log_level(self, level_input, temp_log_dir, monkeypatch):
         """Test change_log_level sets level correctly."""
-        import os
-
-        original_cwd = Path.cwd()
-        try:
-            os.chdir(temp_log_dir)
-            change_log_level(level_input)
-            assert logging.getLogger("fabric_cicd").level == logging.DEBUG
-        finally:
-            os.chdir(original_cwd)
+        monkeypatch.chdir(temp_log_dir)
+        change_log_level(level_input)
+        assert PACKAGE_LOGGER.level == logging.DEBUG
 
     def test_change_log_level_unsupported(self, capsys):
         """Test change_log_level warns on unsupported level."""
@@ -724,8 +739,7 @@ class TestWrapperFunctions:
         configure_logger()
         disable_file_logging()
 
-        root_logger = logging.getLogger()
-        file_handlers = [h for h in root_logger.handlers if isinstance(h, logging.FileHandler)]
+        file_handlers = _file_handlers(ROOT_LOGGER)
         assert len(file_handlers) == 0
 
 
@@ -735,22 +749,15 @@ class TestFileLoggingEnvVar:
     ENV_VAR = "FABRIC_CICD_FILE_LOGGING_ENABLED"
 
     @pytest.mark.parametrize("env_value", ["1", "true", "yes", "True", "YES"])
-    def test_change_log_level_creates_file_handler_with_valid_flags(self, env_value, temp_log_dir):
+    def test_change_log_level_creates_file_handler_with_valid_flags(self, env_value, temp_log_dir, monkeypatch):
         """Test change_log_level('DEBUG') creates file handler for valid enable flag values."""
-        import os
+        monkeypatch.chdir(temp_log_dir)
+        with patch.dict("os.environ", {self.ENV_VAR: env_value}):
+            change_log_level("DEBUG")
 
-        original_cwd = Path.cwd()
-        try:
-            os.chdir(temp_log_dir)
-            with patch.dict("os.environ", {self.ENV_VAR: env_value}):
-                change_log_level("DEBUG")
-
-            root_logger = logging.getLogger()
-            file_handlers = [h for h in root_logger.handlers if isinstance(h, logging.FileHandler)]
-            assert len(file_handlers) == 1
-            assert logging.getLogger("fabric_cicd").level == logging.DEBUG
-        finally:
-            os.chdir(original_cwd)
+        file_handlers = _file_handlers(ROOT_LOGGER)
+        assert len(file_handlers) == 1
+        assert PACKAGE_LOGGER.level == logging.DEBUG
 
     @pytest.mark.parametrize("env_value", ["0", "false", "no", "", "disabled", None])
     def test_change_log_level_no_file_handler_with_invalid_flags(self, env_value):
@@ -758,40 +765,33 @@ class TestFileLoggingEnvVar:
         env = {self.ENV_VAR: env_value} if env_value is not None else {}
         with patch.dict("os.environ", env, clear=False):
             if env_value is None:
-                import os
-
                 os.environ.pop(self.ENV_VAR, None)
             change_log_level("DEBUG")
 
-        root_logger = logging.getLogger()
-        file_handlers = [h for h in root_logger.handlers if isinstance(h, logging.FileHandler)]
+        file_handlers = _file_handlers(ROOT_LOGGER)
         assert len(file_handlers) == 0
-        assert logging.getLogger("fabric_cicd").level == logging.DEBUG
+        assert PACKAGE_LOGGER.level == logging.DEBUG
 
     @pytest.mark.parametrize(
         ("env_value", "expect_warning"),
         [("1", True), (None, False)],
     )
-    def test_sensitive_data_warning_depends_on_env_var(self, env_value, expect_warning, capsys, temp_log_dir):
+    def test_sensitive_data_warning_depends_on_env_var(
+        self, env_value, expect_warning, capsys, temp_log_dir, monkeypatch
+    ):
         """Test sensitive data warning is shown only when env var is set and DEBUG enabled."""
-        import os
+        monkeypatch.chdir(temp_log_dir)
+        env = {self.ENV_VAR: env_value} if env_value is not None else {}
+        with patch.dict("os.environ", env, clear=False):
+            if env_value is None:
+                os.environ.pop(self.ENV_VAR, None)
+            change_log_level("DEBUG")
 
-        original_cwd = Path.cwd()
-        try:
-            os.chdir(temp_log_dir)
-            env = {self.ENV_VAR: env_value} if env_value is not None else {}
-            with patch.dict("os.environ", env, clear=False):
-                if env_value is None:
-                    os.environ.pop(self.ENV_VAR, None)
-                change_log_level("DEBUG")
-
-            captured = capsys.readouterr()
-            if expect_warning:
-                assert "sensitive information" in captured.err
-            else:
-                assert "sensitive information" not in captured.err
-        finally:
-            os.chdir(original_cwd)
+        captured = capsys.readouterr()
+        if expect_warning:
+            assert "sensitive information" in captured.err
+        else:
+            assert "sensitive information" not in captured.err
 
     @pytest.mark.parametrize(
         ("env_value", "expect_file_handler"),
@@ -799,92 +799,67 @@ class TestFileLoggingEnvVar:
     )
     def test_import_time_file_handler_depends_on_env_var(self, env_value, expect_file_handler):
         """Test import-time configure_logger creates file handler only when env var is set."""
-        import os
-
         env = {self.ENV_VAR: env_value} if env_value is not None else {}
         with patch.dict("os.environ", env, clear=False):
             if env_value is None:
                 os.environ.pop(self.ENV_VAR, None)
-            from fabric_cicd._common._validate_env_vars import is_env_flag_enabled
 
             file_logging_enabled = is_env_flag_enabled(self.ENV_VAR)
             configure_logger(disable_log_file=not file_logging_enabled)
 
-        root_logger = logging.getLogger()
-        file_handlers = [h for h in root_logger.handlers if isinstance(h, logging.FileHandler)]
+        file_handlers = _file_handlers(ROOT_LOGGER)
         assert (len(file_handlers) == 1) is expect_file_handler
 
-    def test_file_captures_info_not_debug_at_default_level(self, temp_log_dir):
+    def test_file_captures_info_not_debug_at_default_level(self, temp_log_dir, monkeypatch):
         """Test file logging at default INFO level captures INFO+ but not DEBUG messages."""
-        import os
-
-        original_cwd = Path.cwd()
-        try:
-            os.chdir(temp_log_dir)
-            with patch.dict("os.environ", {self.ENV_VAR: "1"}):
-                # Simulate import-time: env var set, no change_log_level
-                configure_logger()
+        monkeypatch.chdir(temp_log_dir)
+        with patch.dict("os.environ", {self.ENV_VAR: "1"}):
+            # Simulate import-time: env var set, no change_log_level
+            configure_logger()
 
-            fabric_logger = logging.getLogger("fabric_cicd")
-            fabric_logger.debug("Debug should not appear")
-            fabric_logger.info("Info should appear")
-            fabric_logger.error("Error should appear")
+        PACKAGE_LOGGER.debug("Debug should not appear")
+        PACKAGE_LOGGER.info("Info should appear")
+        PACKAGE_LOGGER.error("Error should appear")
 
-            for handler in logging.getLogger().handlers:
-                if hasattr(handler, "flush"):
-                    handler.flush()
+        for handler in ROOT_LOGGER.handlers:
+            if hasattr(handler, "flush"):
+                handler.flush()
 
-            log_file = temp_log_dir / "fabric_cicd.error.log"
-            content = log_file.read_text(encoding="utf-8")
-            assert "Debug should not appear" not in content
-            assert "Info should appear" in content
-            assert "Error should appear" in content
-        finally:
-            os.chdir(original_cwd)
+        log_file = temp_log_dir / "fabric_cicd.error.log"
+        content = log_file.read_text(encoding="utf-8")
+        assert "Debug should not appear" not in content
+        assert "Info should appear" in content
+        assert "Error should appear" in content
 
-    def test_file_captures_debug_after_change_log_level(self, temp_log_dir):
+    def test_file_captures_debug_after_change_log_level(self, temp_log_dir, monkeypatch):
         """Test file logging at DEBUG level captures all messages including DEBUG."""
-        import os
-
-        original_cwd = Path.cwd()
-        try:
-            os.chdir(temp_log_dir)
-            with patch.dict("os.environ", {self.ENV_VAR: "1"}):
-                change_log_level("DEBUG")
+        monkeypatch.chdir(temp_log_dir)
+        with patch.dict("os.environ", {self.ENV_VAR: "1"}):
+            change_log_level("DEBUG")
 
-            fabric_logger = logging.getLogger("fabric_cicd")
-            fabric_logger.debug("Debug should appear")
-            fabric_logger.info("Info should appear")
+        PACKAGE_LOGGER.debug("Debug should appear")
+        PACKAGE_LOGGER.info("Info should appear")
 
-            for handler in logging.getLogger().handlers:
-                if hasattr(handler, "flush"):
-                    handler.flush()
+        for handler in ROOT_LOGGER.handlers:
+            if hasattr(handler, "flush"):
+                handler.flush()
 
-            log_file = temp_log_dir / "fabric_cicd.error.log"
-            content = log_file.read_text(encoding="utf-8")
-            assert "Debug should appear" in content
-            assert "Info should appear" in content
-        finally:
-            os.chdir(original_cwd)
+        log_file = temp_log_dir / "fabric_cicd.error.log"
+        content = log_file.read_text(encoding="utf-8")
+        assert "Debug should appear" in content
+        assert "Info should appear" in content
 
-    def test_no_file_created_without_env_var(self, temp_log_dir):
+    def test_no_file_created_without_env_var(self, temp_log_dir, monkeypatch):
         """Test no log file is created when env var is not set, even with errors logged."""
-        import os
-
-        original_cwd = Path.cwd()
-        try:
-            os.chdir(temp_log_dir)
-            with patch.dict("os.environ", {}, clear=False):
-                os.environ.pop(self.ENV_VAR, None)
-                configure_logger(disable_log_file=True)
+        monkeypatch.chdir(temp_log_dir)
+        with patch.dict("os.environ", {}, clear=False):
+            os.environ.pop(self.ENV_VAR, None)
+            configure_logger(disable_log_file=True)
 
-            fabric_logger = logging.getLogger("fabric_cicd")
-            fabric_logger.error("This error should not create a file")
+        PACKAGE_LOGGER.error("This error should not create a file")
 
-            log_file = temp_log_dir / "fabric_cicd.error.log"
-            assert not log_file.exists()
-        finally:
-            os.chdir(original_cwd)
+        log_file = temp_log_dir / "fabric_cicd.error.log"
+        assert not log_file.exists()
 
 
 class TestConfigureExternalFileLoggingWrapper:
@@ -896,21 +871,19 @@ class TestConfigureExternalFileLoggingWrapper:
 
         configure_external_file_logging(external_logger)
 
-        package_logger = logging.getLogger("fabric_cicd")
-        assert package_logger.level == logging.DEBUG
+        assert PACKAGE_LOGGER.level == logging.DEBUG
 
         console_handlers = [
             h
-            for h in package_logger.handlers
+            for h in PACKAGE_LOGGER.handlers
             if isinstance(h, logging.StreamHandler) and not isinstance(h, logging.FileHandler)
         ]
         assert len(console_handlers) == 1
         assert console_handlers[0].level == logging.INFO
 
-        root_logger = logging.getLogger()
         external_handlers = [
             h
-            for h in root_logger.handlers
+            for h in ROOT_LOGGER.handlers
             if isinstance(h, logging.FileHandler) and getattr(h, "_fabric_cicd_external", False)
         ]
         assert len(external_handlers) == 1
@@ -931,15 +904,14 @@ class TestConfigureExternalFileLoggingWrapper:
 
         configure_external_file_logging(external_logger)
 
-        fabric_logger = logging.getLogger("fabric_cicd")
-        fabric_logger.debug("Debug message")
-        fabric_logger.info("Info message")
+        PACKAGE_LOGGER.debug("Debug message")
+        PACKAGE_LOGGER.info("Info message")
 
         azure_logger = logging.getLogger("azure.identity")
         azure_logger.setLevel(logging.DEBUG)
         azure_logger.debug("Azure debug")
 
-        for handler in logging.getLogger().handlers:
+        for handler in ROOT_LOGGER.handlers:
             if hasattr(handler, "flush"):
                 handler.flush()
 
@@ -954,8 +926,6 @@ class TestExceptionHandler:
 
     def test_handles_custom_exception(self):
         """Test exception handler handles custom exceptions."""
-        from fabric_cicd._common._exceptions import InputError
-
         test_logger = logging.getLogger("fabric_cicd.test")
         exception = InputError("Test error message", logger=test_logger)
         configure_logger(disable_log_file=True)
@@ -974,86 +944,58 @@ class TestExceptionHandler:
 
     def test_writes_to_console_only_logger(self):
         """Test that exception handler writes to console_only logger."""
-        from fabric_cicd._common._exceptions import InputError
-
         configure_logger(disable_log_file=True)
         test_logger = logging.getLogger("fabric_cicd.test")
         exception = InputError("User-facing error", logger=test_logger)
 
-        with patch.object(logging.getLogger("console_only"), "error") as mock_error:
+        with patch.object(CONSOLE_ONLY_LOGGER, "error") as mock_error:
             exception_handler(InputError, exception, None)
             mock_error.assert_called_once()
             message = mock_error.call_args[0][0]
             assert "User-facing error" in message
             assert "See" not in message
 
-    def test_removes_console_handler_when_using_default_file(self, temp_log_dir):
+    def test_removes_console_handler_when_using_default_file(self, temp_log_dir, monkeypatch):
         """Test that exception handler removes console handler when using default file handler."""
-        import os
-
-        from fabric_cicd._common._exceptions import InputError
-
-        original_cwd = Path.cwd()
-        try:
-            os.chdir(temp_log_dir)
-            configure_logger()
-            test_logger = logging.getLogger("fabric_cicd.test")
-            exception = InputError("Test error", logger=test_logger)
+        monkeypatch.chdir(temp_log_dir)
+        configure_logger()
+        test_logger = logging.getLogger("fabric_cicd.test")
+        exception = InputError("Test error", logger=test_logger)
 
-            package_logger = logging.getLogger("fabric_cicd")
-            assert len(package_logger.handlers) >= 1
+        assert len(PACKAGE_LOGGER.handlers) >= 1
 
-            exception_handler(InputError, exception, None)
+        exception_handler(InputError, exception, None)
 
-            managed_handlers = [h for h in package_logger.handlers if getattr(h, "_fabric_cicd_managed", False)]
-            assert len(managed_handlers) == 0
-        finally:
-            os.chdir(original_cwd)
+        managed_handlers = [h for h in PACKAGE_LOGGER.handlers if getattr(h, "_fabric_cicd_managed", False)]
+        assert len(managed_handlers) == 0
 
 
 class TestFileLoggingIntegration:
     """Integration tests for file logging functionality."""
 
-    def test_default_file_handler_writes_logs(self, temp_log_dir):
+    def test_default_file_handler_writes_logs(self, temp_log_dir, monkeypatch):
         """Test that default file handler actually writes logs."""
-        import os
-
-        original_cwd = Path.cwd()
-
-        try:
-            os.chdir(temp_log_dir)
-            configure_logger()
-
-            logger = logging.getLogger("fabric_cicd")
-            logger.error("Error message for test")
+        monkeypatch.chdir(temp_log_dir)
+        configure_logger()
 
-            for handler in logging.getLogger().handlers:
-                if hasattr(handler, "flush"):
-                    handler.flush()
+        PACKAGE_LOGGER.error("Error message for test")
 
-            log_file = temp_log_dir / "fabric_cicd.error.log"
-            assert log_file.exists()
-            content = log_file.read_text(encoding="utf-8")
-            assert "Error message for test" in content
+        for handler in ROOT_LOGGER.handlers:
+            if hasattr(handler, "flush"):
+                handler.flush()
 
-        finally:
-            os.chdir(original_cwd)
+        log_file = temp_log_dir / "fabric_cicd.error.log"
+        assert log_file.exists()
+        content = log_file.read_text(encoding="utf-8")
+        assert "Error message for test" in content
 
-    def test_file_not_created_until_log_written(self, temp_log_dir):
+    def test_file_not_created_until_log_written(self, temp_log_dir, monkeypatch):
         """Test that log file is not created until first log is written (delay=True)."""
-        import os
-
-        original_cwd = Path.cwd()
-
-        try:
-            os.chdir(temp_log_dir)
-            configure_logger()
-
-            log_file = temp_log_dir / "fabric_cicd.error.log"
-            assert not log_file.exists()
+        monkeypatch.chdir(temp_log_dir)
+        configure_logger()
 
-        finally:
-            os.chdir(original_cwd)
+        log_file = temp_log_dir / "fabric_cicd.error.log"
+        assert not log_file.exists()
 
     def test_external_handler_writes_fabric_cicd_logs(self, external_logger_with_handler):
         """Test that external handler writes fabric_cicd logs to the shared file."""
@@ -1063,10 +1005,9 @@ class TestFileLoggingIntegration:
 
         configure_external_file_logging(external_logger)
 
-        fabric_logger = logging.getLogger("fabric_cicd")
-        fabric_logger.debug("Fabric CICD message")
+        PACKAGE_LOGGER.debug("Fabric CICD message")
 
-        for handler in logging.getLogger().handlers:
+        for handler in ROOT_LOGGER.handlers:
             if hasattr(handler, "flush"):
                 handler.flush()
         external_handler.flush()
@@ -1081,10 +1022,9 @@ class TestFileLoggingIntegration:
 
         configure_external_file_logging(external_logger)
 
-        console_only_logger = logging.getLogger("console_only")
-        console_only_logger.error("Console only error")
+        CONSOLE_ONLY_LOGGER.error("Console only error")
 
-        for handler in logging.getLogger().handlers:
+        for handler in ROOT_LOGGER.handlers:
             if hasattr(handler, "flush"):
                 handler.flush()
 
@@ -1155,10 +1095,9 @@ class TestExternalHandlerReconfiguration:
 
         configure_external_file_logging(external_logger)
 
-        root_logger = logging.getLogger()
         external_handlers = [
             h
-            for h in root_logger.handlers
+            for h in ROOT_LOGGER.handlers
             if isinstance(h, RotatingFileHandler) and getattr(h, "_fabric_cicd_external", False)
         ]
 